@@ -0,0 +1,143 @@
+import json
+import os
+import pickle
+import time
+from typing import Any, Dict, List, Optional
+
+
+class GenomeArchive:
+    """GenomeArchive A folder of champion genomes from past training runs
+
+    Every run adds its best genome as a pickle file and a line of metadata to
+    `index.json`. Runs started from a random population are cold runs; their
+    generations to reach the fitness threshold are the baseline warm started
+    runs are compared to.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, folder: str) -> None:
+        """__init__ Opens an archive, creating its folder if needed
+
+        Parameters
+        ----------
+        folder : str
+            The folder the archive is kept in
+        """
+
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        index_path = os.path.join(folder, self.INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path) as file:
+                self.runs = json.load(file)
+        else:
+            self.runs = []
+
+    def add(self, genome: Any, result: Dict[str, Any]) -> None:
+        """add Stores the champion of a run
+
+        Parameters
+        ----------
+        genome : neat.DefaultGenome
+            The best genome of the run
+        result : Dict[str, Any]
+            The outcome of the run, see `NeatHelper.summary`
+        """
+
+        name = f"champion-{len(self.runs):04d}.pkl"
+        with open(os.path.join(self.folder, name), "wb") as file:
+            pickle.dump(genome, file)
+        self.runs.append(
+            {
+                "file": name,
+                "time": time.time(),
+                "fitness": genome.fitness,
+                **result,
+            }
+        )
+        # Replace the index in one step so it is never left half written
+        index_path = os.path.join(self.folder, self.INDEX_FILE)
+        with open(index_path + ".tmp", "w") as file:
+            json.dump(self.runs, file, indent=2)
+        os.replace(index_path + ".tmp", index_path)
+
+    def champions(self, count: int, config: Any) -> List[Any]:
+        """champions Loads the fittest stored genomes
+
+        Genomes that do not have the inputs and outputs of `config` are left
+        out, so changing the network layout never breaks a warm start.
+
+        Parameters
+        ----------
+        count : int
+            The most genomes to load
+        config : neat.genome.DefaultGenomeConfig
+            The genome configuration of the new run
+
+        Returns
+        -------
+        List[neat.DefaultGenome]
+            The genomes, fittest first
+        """
+
+        genomes = []
+        for run in sorted(self.runs, key=lambda r: r["fitness"], reverse=True):
+            if len(genomes) == count:
+                break
+            genome = self._load(run)
+            if self._fits(genome, config):
+                genomes.append(genome)
+        return genomes
+
+    def cold_generations(
+        self, setup: Dict[str, Any], config: Any
+    ) -> Optional[float]:
+        """cold_generations Average generations cold runs took to succeed
+
+        Only runs trained the same way are compared, a different threshold,
+        course or configuration changes how long a run takes.
+
+        Parameters
+        ----------
+        setup : Dict[str, Any]
+            Entries a run must have stored with the same values to count,
+            see `NeatHelper.setup`
+        config : neat.genome.DefaultGenomeConfig
+            The genome configuration of the new run, runs whose genomes no
+            longer fit it are left out
+
+        Returns
+        -------
+        float, optional
+            The mean over matching cold runs that reached the fitness
+            threshold, or None when there are none
+        """
+
+        generations = [
+            run["generations"]
+            for run in self.runs
+            if run.get("seeded", 0) == 0
+            and run["reached_threshold"]
+            and all(run.get(key) == value for key, value in setup.items())
+            and self._fits(self._load(run), config)
+        ]
+        if len(generations) == 0:
+            return None
+        return sum(generations) / len(generations)
+
+    def _load(self, run: Dict[str, Any]) -> Any:
+        """_load Reads the genome stored for a run"""
+
+        with open(os.path.join(self.folder, run["file"]), "rb") as file:
+            return pickle.load(file)
+
+    @staticmethod
+    def _fits(genome: Any, config: Any) -> bool:
+        """_fits Whether a genome has the inputs and outputs of a config"""
+
+        keys = set(config.input_keys) | set(config.output_keys)
+        ends = {node for key in genome.connections for node in key}
+        if not set(config.output_keys) <= set(genome.nodes):
+            return False
+        return ends <= keys | set(genome.nodes)
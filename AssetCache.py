@@ -0,0 +1,172 @@
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+# File signature followed by the length of the JSON index
+HEADER = struct.Struct("<8sQ")
+MAGIC = b"DINOPIX1"
+
+
+class AssetCache:
+    """AssetCache Keeps scaled sprites as raw pixels in a single file
+
+    Decoding a PNG and scaling it is only done the first time an image is
+    asked for. The scaled pixels are then baked into the cache file, which
+    later launches and worker processes memory-map and turn into surfaces
+    with `pygame.image.frombuffer` without decoding anything.
+
+    The file holds a JSON index after a short header, followed by the RGBA
+    pixels of every image. An image is baked again when the modification time
+    or size of its source file, or the scale it is asked for, changes.
+    """
+
+    def __init__(self, path: str) -> None:
+        """__init__ Opens a cache file, which is created when first needed
+
+        Parameters
+        ----------
+        path : str
+            The cache file
+        """
+
+        self.path = path
+        self._index = {}
+        self._pixels = None
+        self._data_start = 0
+        try:
+            with open(path, "rb") as file:
+                pixels = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_size = HEADER.unpack_from(pixels)
+            if magic == MAGIC:
+                start = HEADER.size + index_size
+                self._index = json.loads(pixels[HEADER.size : start])
+                self._pixels = pixels
+                self._data_start = start
+        except (OSError, ValueError, struct.error):
+            # A missing or damaged cache is baked again from the sources
+            self._index = {}
+
+    @staticmethod
+    def _key(
+        source: str, scale: Optional[float], size: Optional[Tuple[int, int]]
+    ) -> str:
+        """_key Names an image by its source and how it is scaled"""
+
+        return json.dumps([os.path.normpath(source), scale, size])
+
+    def image(
+        self,
+        source: str,
+        scale: Optional[float] = None,
+        size: Optional[Tuple[int, int]] = None,
+    ) -> Any:
+        """image Returns a scaled image
+
+        Parameters
+        ----------
+        source : str
+            The PNG file of the image
+        scale : float, optional
+            The factor the image is scaled by, as with
+            `pygame.transform.scale_by`
+        size : Tuple[int, int], optional
+            The size the image is scaled to, as with `pygame.transform.scale`
+
+        Returns
+        -------
+        pygame.surface.Surface
+            An RGBA surface of the scaled image. Surfaces read from the cache
+            share its memory, call `convert_alpha` before drawing them.
+        """
+
+        import pygame
+
+        key = self._key(source, scale, size)
+        stat = os.stat(source)
+        entry = self._index.get(key)
+        if (
+            entry is not None
+            and self._pixels is not None
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["bytes"] == stat.st_size
+        ):
+            start = self._data_start + entry["offset"]
+            end = start + entry["width"] * entry["height"] * 4
+            return pygame.image.frombuffer(
+                memoryview(self._pixels)[start:end],
+                (entry["width"], entry["height"]),
+                "RGBA",
+            )
+
+        image = pygame.image.load(source).convert_alpha()
+        if scale is not None:
+            image = pygame.transform.scale_by(image, scale)
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        self._bake(
+            key,
+            {
+                "mtime": stat.st_mtime_ns,
+                "bytes": stat.st_size,
+                "width": image.get_width(),
+                "height": image.get_height(),
+            },
+            pygame.image.tobytes(image, "RGBA"),
+        )
+        return image
+
+    def _bake(self, key: str, entry: Dict[str, int], pixels: bytes) -> None:
+        """_bake Rewrites the cache file with a new image added
+
+        The new file replaces the old one in a single step, so other
+        processes reading the old file are not affected.
+
+        Parameters
+        ----------
+        key : str
+            The name of the image
+        entry : Dict[str, int]
+            The source file details and size of the image
+        pixels : bytes
+            The RGBA pixels of the image
+        """
+
+        images = []
+        for other, other_entry in self._index.items():
+            if other == key or self._pixels is None:
+                continue
+            start = self._data_start + other_entry["offset"]
+            length = other_entry["width"] * other_entry["height"] * 4
+            images.append(
+                (other, other_entry, self._pixels[start : start + length])
+            )
+        images.append((key, entry, pixels))
+
+        index = {}
+        offset = 0
+        for name, image_entry, image_pixels in images:
+            index[name] = {**image_entry, "offset": offset}
+            offset += len(image_pixels)
+        index_bytes = json.dumps(index).encode()
+        # Processes starting at the same time each write their own file
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, "w+b") as file:
+                file.write(HEADER.pack(MAGIC, len(index_bytes)))
+                file.write(index_bytes)
+                for _, _, image_pixels in images:
+                    file.write(image_pixels)
+                file.flush()
+                # Map the written file itself, the path may be replaced again
+                # by another process at any time
+                pixels = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            os.replace(temporary, self.path)
+        except OSError as e:
+            # Without a writable cache images are decoded on every launch
+            print(e)
+            return
+        self._index = index
+        self._pixels = pixels
+        self._data_start = HEADER.size + len(index_bytes)
@@ -0,0 +1,192 @@
+import math
+import random
+from typing import List, Tuple
+
+import numpy as np
+
+
+def next_attempt(
+    rng: random.Random, start: float, spawn_percentage: float
+) -> float:
+    """next_attempt Picks the frame of the next spawn attempt
+
+    Spawns are attempted on each frame with a `1 - spawn_percentage` chance,
+    so the number of frames without an attempt follows a geometric
+    distribution. Sampling it directly gives the next attempt with a single
+    random number instead of one per frame.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The random number generator to draw from
+    start : float
+        The first frame an attempt can be made on
+    spawn_percentage : float
+        The chance that no obstacle is attempted on a frame
+
+    Returns
+    -------
+    float
+        The frame of the next attempt
+    """
+
+    # 1 - random() is never 0, so the logarithm is always defined
+    return start + math.floor(
+        math.log(1 - rng.random()) / math.log(spawn_percentage)
+    )
+
+
+def generate_course(
+    seed: int,
+    frames: int,
+    gaps: List[float],
+    speed: int,
+    spawn_percentage: float,
+) -> np.ndarray:
+    """generate_course Generates the obstacle spawns of a course
+
+    Follows the same rules as `ObstacleHandler.generate`: each frame an
+    obstacle is attempted with a `1 - spawn_percentage` chance, a sprite is
+    picked at random and it is only placed if the previous obstacle has
+    moved far enough away from the spawn point. Frames on which not even the
+    narrowest sprite fits are skipped over, and `next_attempt` jumps straight
+    to the next attempt after them.
+
+    Parameters
+    ----------
+    seed : int
+        Seed for the random number generator
+    frames : int
+        The number of frames to generate spawns for
+    gaps : List[float]
+        The distance in pixels needed between the previous obstacle and the
+        spawn point to place each sprite
+    speed : int
+        The number of pixels obstacles move each frame
+    spawn_percentage : float
+        The chance that no obstacle is attempted on a frame
+
+    Returns
+    -------
+    np.ndarray
+        An array of `(frame, sprite index)` rows
+    """
+
+    rng = random.Random(seed)
+    spawns = []
+    last_spawn = None
+    # Frames after a spawn before the narrowest sprite fits again
+    min_frames = math.floor(min(gaps) / speed) + 1
+    frame = next_attempt(rng, 0, spawn_percentage)
+    while frame < frames:
+        index = rng.randrange(len(gaps))
+        if last_spawn is None or speed * (frame - last_spawn) > gaps[index]:
+            spawns.append((frame, index))
+            last_spawn = frame
+        start = frame + 1
+        if last_spawn is not None:
+            start = max(start, last_spawn + min_frames)
+        frame = next_attempt(rng, start, spawn_percentage)
+    return np.array(spawns, dtype=np.int32).reshape(-1, 2)
+
+
+class CourseTape:
+    """CourseTape An obstacle course generated ahead of time
+
+    A tape is a compact `int32` array. The first row holds
+    `(period, number of spawns)` and every following row is a
+    `(frame, sprite index)` spawn. After `period` frames the course repeats.
+    The array is saved to a file that is memory-mapped when loaded, so any
+    number of processes can read the same course without copying it.
+    """
+
+    def __init__(self, data: np.ndarray) -> None:
+        """__init__ Creates a tape from an existing array
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The tape array, including the header row
+        """
+
+        if data[0][1] == 0:
+            raise ValueError("The course has no obstacles")
+        self.data = data
+        self.period = int(data[0][0])
+        self.spawns = data[1 : int(data[0][1]) + 1]
+
+    @classmethod
+    def generate(
+        cls,
+        seed: int,
+        frames: int,
+        gaps: List[float],
+        speed: int,
+        spawn_percentage: float,
+    ) -> "CourseTape":
+        """generate Generates a new tape
+
+        The parameters are the same as for `generate_course`. The period is
+        extended past `frames` when needed so the gap between the last
+        obstacle and the first obstacle of the next repeat is kept.
+        """
+
+        spawns = generate_course(seed, frames, gaps, speed, spawn_percentage)
+        if len(spawns) == 0:
+            raise ValueError("The course has no obstacles")
+        first_frame, first_index = spawns[0]
+        period = max(
+            frames,
+            int(spawns[-1][0] - first_frame + gaps[first_index] // speed + 1),
+        )
+        data = np.empty((len(spawns) + 1, 2), dtype=np.int32)
+        data[0] = (period, len(spawns))
+        data[1:] = spawns
+        return cls(data)
+
+    def spawn(self, number: int) -> Tuple[int, int]:
+        """spawn Returns a spawn on the course
+
+        Parameters
+        ----------
+        number : int
+            The position of the spawn from the start of the course. Numbers
+            past the end of the tape continue into its repeats.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The frame of the spawn and the index of the sprite to spawn
+        """
+
+        repeat, index = divmod(number, len(self.spawns))
+        frame, sprite = self.spawns[index]
+        return int(frame) + repeat * self.period, int(sprite)
+
+    def save(self, path: str) -> None:
+        """save Saves the tape to a `.npy` file
+
+        Parameters
+        ----------
+        path : str
+            The file to write
+        """
+
+        np.save(path, self.data)
+
+    @classmethod
+    def load(cls, path: str) -> "CourseTape":
+        """load Memory-maps a tape saved with `save`
+
+        Parameters
+        ----------
+        path : str
+            The file to read
+
+        Returns
+        -------
+        CourseTape
+            The tape, read directly from the file without copying it
+        """
+
+        return cls(np.load(path, mmap_mode="r"))
@@ -0,0 +1,116 @@
+from multiprocessing.managers import BaseManager
+import threading
+from typing import Any, List, Optional, Tuple
+
+
+class MigrationBoard:
+    """MigrationBoard Exchanges top genomes between islands
+
+    Every island publishes its best genomes under its own name and collects
+    the genomes published by all other islands. Only the latest genomes of
+    each island are kept, so islands running at different speeds never wait
+    on each other.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._genomes = {}
+        self._solved = False
+
+    def publish(self, island: str, genomes: List[Any]) -> None:
+        """publish Replaces the genomes offered by an island
+
+        Parameters
+        ----------
+        island : str
+            The name of the publishing island
+        genomes : List[Any]
+            The island's best genomes, with their fitness set
+        """
+
+        with self._lock:
+            self._genomes[island] = list(genomes)
+
+    def collect(self, island: str) -> List[Any]:
+        """collect Returns the genomes offered by every other island
+
+        Parameters
+        ----------
+        island : str
+            The name of the collecting island
+
+        Returns
+        -------
+        List[Any]
+            The genomes, best first
+        """
+
+        with self._lock:
+            genomes = [
+                genome
+                for other, offered in self._genomes.items()
+                if other != island
+                for genome in offered
+            ]
+        return sorted(genomes, key=lambda genome: genome.fitness, reverse=True)
+
+    def best(self) -> Optional[Any]:
+        """best Returns the fittest genome published by any island"""
+
+        with self._lock:
+            genomes = [
+                genome
+                for offered in self._genomes.values()
+                for genome in offered
+            ]
+        if len(genomes) == 0:
+            return None
+        return max(genomes, key=lambda genome: genome.fitness)
+
+    def solve(self) -> None:
+        """solve Marks the problem as solved so all islands stop"""
+
+        self._solved = True
+
+    def solved(self) -> bool:
+        """solved Returns whether any island has reached the threshold"""
+
+        return self._solved
+
+
+_board = MigrationBoard()
+
+
+def get_board() -> MigrationBoard:
+    """get_board Returns the board served by this process"""
+
+    return _board
+
+
+class MigrationManager(BaseManager):
+    """MigrationManager Serves a `MigrationBoard` over a socket
+
+    Start it with `start` on the node hosting the board; islands on any node
+    create it with the same address and authkey and call `connect`.
+    """
+
+
+MigrationManager.register("get_board", callable=get_board)
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """parse_address Splits a `host:port` string
+
+    Parameters
+    ----------
+    address : str
+        The address, for example `127.0.0.1:5000`
+
+    Returns
+    -------
+    Tuple[str, int]
+        The host and the port
+    """
+
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
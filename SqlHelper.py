@@ -45,6 +45,14 @@ def create_table(database_name, table_name, username, password):
                 f"CREATE TABLE {table_name} (id int NOT NULL \
 AUTO_INCREMENT PRIMARY KEY, name VARCHAR(25), score INT)"
             )
+        # Index used to page through scores in order without sorting them
+        cursor.execute(
+            f"SHOW INDEX FROM {table_name} WHERE Key_name = 'score_id'"
+        )
+        if len(cursor.fetchall()) == 0:
+            cursor.execute(
+                f"CREATE INDEX score_id ON {table_name} (score, id)"
+            )
     except Exception as e:
         print(e)
 
@@ -96,6 +104,87 @@ def top_five_scores(username, password, table_name, database_name):
         print(e)
 
 
+def scores_page(
+    username,
+    password,
+    table_name,
+    database_name,
+    size,
+    after=None,
+    before=None,
+):
+    """scores_page Fetches one page of scores, highest first
+
+    Pages are found from the `(score, id)` of the row next to them rather
+    than an offset, so any page is read straight from the `score_id` index
+    without sorting or skipping over the rows before it.
+
+    Parameters
+    ----------
+    username : str
+        Username to connect to database
+    password : str
+        Password to connect to database
+    table_name : str
+        The name of the scores table
+    database_name : str
+        The name of the database
+    size : int
+        The number of rows on a page
+    after : tuple, optional
+        `(score, id)` of the last row of the previous page, to fetch the next
+        page, by default None
+    before : tuple, optional
+        `(score, id)` of the first row of the next page, to fetch the
+        previous page, by default None
+
+    Returns
+    -------
+    List[tuple]
+        `(id, name, score)` rows, or the first page if neither `after` nor
+        `before` is given
+    """
+
+    from mysql import connector
+
+    try:
+        connection = connector.connect(
+            host="localhost",
+            username=username,
+            password=password,
+            database=database_name,
+        )
+        cursor = connection.cursor()
+        if after is not None:
+            cursor.execute(
+                f"SELECT id, name, score FROM {table_name} WHERE score < %s \
+OR (score = %s AND id < %s) ORDER BY score DESC, id DESC LIMIT %s",
+                (after[0], after[0], after[1], size),
+            )
+            rows = cursor.fetchall()
+        elif before is not None:
+            # Walk the index upwards from the row, then put the page back in
+            # descending order
+            cursor.execute(
+                f"SELECT id, name, score FROM {table_name} WHERE score > %s \
+OR (score = %s AND id > %s) ORDER BY score ASC, id ASC LIMIT %s",
+                (before[0], before[0], before[1], size),
+            )
+            rows = cursor.fetchall()[::-1]
+        else:
+            cursor.execute(
+                f"SELECT id, name, score FROM {table_name} \
+ORDER BY score DESC, id DESC LIMIT %s",
+                (size,),
+            )
+            rows = cursor.fetchall()
+        connection.close()
+        return rows
+    except Exception as e:
+        print(e)
+        return []
+
+
 def delete_scores(username, password, table_name, database_name):
     # Importing sql connector
     from mysql import connector
@@ -160,3 +249,130 @@ def greater_score_count(username, password, table_name, database_name, score):
         return scoregreatercount
     except Exception as e:
         print(e)
+
+
+TRAINING_RUNS_TABLE = "training_runs"
+GENOME_RESULTS_TABLE = "genome_results"
+
+
+def create_training_tables(username, password, database_name):
+    """create_training_tables Creates the tables that store training results
+
+    `training_runs` has one row per call to `start_training_run` and
+    `genome_results` has one row for every genome evaluated in a run.
+
+    Parameters
+    ----------
+    username : str
+        Username to connect to database
+    password : str
+        Password to connect to database
+    database_name : str
+        The name of the database, which must already exist
+    """
+
+    from mysql import connector
+
+    try:
+        connection = connector.connect(
+            host="localhost",
+            username=username,
+            password=password,
+            database=database_name,
+        )
+        cursor = connection.cursor()
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {TRAINING_RUNS_TABLE} (id int NOT \
+NULL AUTO_INCREMENT PRIMARY KEY, started_at DATETIME DEFAULT \
+CURRENT_TIMESTAMP, config VARCHAR(255))"
+        )
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {GENOME_RESULTS_TABLE} (run_id INT \
+NOT NULL, generation INT NOT NULL, genome_id INT NOT NULL, species_id INT, \
+fitness DOUBLE, PRIMARY KEY (run_id, generation, genome_id))"
+        )
+        connection.commit()
+        connection.close()
+    except Exception as e:
+        print(e)
+
+
+def start_training_run(username, password, database_name, config):
+    """start_training_run Records the start of a training run
+
+    Parameters
+    ----------
+    username : str
+        Username to connect to database
+    password : str
+        Password to connect to database
+    database_name : str
+        The name of the database
+    config : str
+        The path of the NEAT configuration used for the run
+
+    Returns
+    -------
+    int
+        The id of the new run, or `None` if it could not be recorded
+    """
+
+    from mysql import connector
+
+    try:
+        connection = connector.connect(
+            host="localhost",
+            username=username,
+            password=password,
+            database=database_name,
+        )
+        cursor = connection.cursor()
+        cursor.execute(
+            f"INSERT INTO {TRAINING_RUNS_TABLE} (config) VALUES (%s)",
+            (config,),
+        )
+        run_id = cursor.lastrowid
+        connection.commit()
+        connection.close()
+        return run_id
+    except Exception as e:
+        print(e)
+
+
+def insert_generation_results(username, password, database_name, rows):
+    """insert_generation_results Stores the results of a whole generation
+
+    All rows are inserted with a single `executemany` in one transaction, so
+    even very large generations are written in one round trip.
+
+    Parameters
+    ----------
+    username : str
+        Username to connect to database
+    password : str
+        Password to connect to database
+    database_name : str
+        The name of the database
+    rows : List[tuple]
+        `(run_id, generation, genome_id, species_id, fitness)` for each genome
+    """
+
+    from mysql import connector
+
+    try:
+        connection = connector.connect(
+            host="localhost",
+            username=username,
+            password=password,
+            database=database_name,
+        )
+        cursor = connection.cursor()
+        cursor.executemany(
+            f"INSERT INTO {GENOME_RESULTS_TABLE} (run_id, generation, \
+genome_id, species_id, fitness) VALUES (%s, %s, %s, %s, %s)",
+            rows,
+        )
+        connection.commit()
+        connection.close()
+    except Exception as e:
+        print(e)
@@ -0,0 +1,114 @@
+import json
+import math
+import time
+from typing import Dict, List, Optional
+
+
+class FrameTelemetry:
+    """FrameTelemetry Measures frame timing and input latency of a session
+
+    Frame times are counted in a histogram of one millisecond buckets. A frame
+    that takes more than one and a half frame budgets counts as dropping the
+    frames that could have been shown in that time. Input latency is measured
+    from the moment a key press is polled to the moment the frame showing its
+    effect has been handed to the display.
+    """
+
+    HISTOGRAM_LIMIT = 100
+
+    def __init__(self, fps: int) -> None:
+        """__init__ Creates an empty record for a session
+
+        Parameters
+        ----------
+        fps : int
+            The target frame rate
+        """
+
+        self.fps = fps
+        self.budget = 1000 / fps
+        self.histogram = [0] * (self.HISTOGRAM_LIMIT + 1)
+        self.frames = 0
+        self.dropped = 0
+        self.latencies = []
+        self._started = time.perf_counter()
+        self._last_frame = None
+
+    def frame(self) -> None:
+        """frame Marks the start of a frame, called once after every tick"""
+
+        now = time.perf_counter()
+        if self._last_frame is not None:
+            frame_time = (now - self._last_frame) * 1000
+            self.histogram[min(int(frame_time), self.HISTOGRAM_LIMIT)] += 1
+            self.frames += 1
+            if frame_time > self.budget * 1.5:
+                self.dropped += round(frame_time / self.budget) - 1
+        self._last_frame = now
+
+    def presented(self, polled: float) -> None:
+        """presented Records the latency of an input shown in this frame
+
+        Call once the first frame showing the effect of the input has been
+        handed to the display.
+
+        Parameters
+        ----------
+        polled : float
+            The `time.perf_counter` value at which the input was polled
+        """
+
+        self.latencies.append((time.perf_counter() - polled) * 1000)
+
+    @staticmethod
+    def _percentile(values: List[float], percent: float) -> Optional[float]:
+        """_percentile Returns a percentile by the nearest rank method"""
+
+        if len(values) == 0:
+            return None
+        ordered = sorted(values)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return round(ordered[rank - 1], 3)
+
+    def summary(self) -> Dict[str, object]:
+        """summary Returns the measurements of the session
+
+        Returns
+        -------
+        Dict[str, object]
+            The frame time histogram with the last bucket holding every frame
+            of `HISTOGRAM_LIMIT` milliseconds or more, the dropped frame count
+            and the input latency percentiles in milliseconds
+        """
+
+        duration = time.perf_counter() - self._started
+        return {
+            "time": time.time(),
+            "fps": self.fps,
+            "duration": round(duration, 3),
+            "frames": self.frames,
+            "average_fps": round(self.frames / duration, 3),
+            "dropped_frames": self.dropped,
+            "frame_time_histogram": {
+                str(bucket): count
+                for bucket, count in enumerate(self.histogram)
+                if count > 0
+            },
+            "inputs": len(self.latencies),
+            "latency": {
+                f"p{percent}": self._percentile(self.latencies, percent)
+                for percent in (50, 95, 99, 100)
+            },
+        }
+
+    def save(self, path: str) -> None:
+        """save Appends the session summary as a JSON line to a file
+
+        Parameters
+        ----------
+        path : str
+            The file to append to
+        """
+
+        with open(path, "a") as file:
+            file.write(json.dumps(self.summary()) + "\n")
@@ -10,12 +10,35 @@
 # Version: 1.0.0
 
 import os
-from typing import Any, List
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+import copy
+import functools
+import heapq
+import itertools
+import json
 import math
+import multiprocessing
 import random
+import secrets
+import socket
+import threading
+import time
+import tracemalloc
 import neat
 import argparse
-from SqlHelper import create_table, insertData, top_five_scores
+from ArchiveHelper import GenomeArchive
+from AssetCache import AssetCache
+from CourseHelper import CourseTape, next_attempt
+from IslandHelper import MigrationManager, get_board, parse_address
+from SqlHelper import (
+    create_table,
+    create_training_tables,
+    insert_generation_results,
+    insertData,
+    scores_page,
+    start_training_run,
+)
+from TelemetryHelper import FrameTelemetry
 
 parser = argparse.ArgumentParser(
     description="A simple game", formatter_class=argparse.RawTextHelpFormatter
@@ -28,9 +51,180 @@ parser.add_argument(
 Artificial Intelligence",
     required=True,
 )
+parser.add_argument(
+    "--action-repeat",
+    type=int,
+    default=1,
+    dest="action_repeat",
+    help="Number of frames on the ground an AI holds a decision not to jump \
+before querying its network again (default: 1)",
+)
+parser.add_argument(
+    "--headless",
+    action="store_true",
+    help="Train without drawing the game. Frames run as fast as possible and \
+stretches of the course\nwithout obstacles in reach are skipped over.",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    help="Seed for generating obstacle courses. Every genome of a generation \
+faces the same\ncourse and runs with the same seed face the same courses.",
+)
+parser.add_argument(
+    "--course",
+    help="Path to a course tape (.npy) that is memory-mapped and used for \
+every game. It is\ngenerated from --seed (or 0) if the file does not exist.",
+)
+parser.add_argument(
+    "--islands",
+    type=int,
+    default=0,
+    help="Number of island populations to evolve in parallel processes. \
+Islands exchange their\ntop genomes through a migration server on \
+--migration-address.",
+)
+parser.add_argument(
+    "--join",
+    metavar="HOST:PORT",
+    help="Evolve one island in this process, exchanging genomes with the \
+migration server\nof a run started with --islands on another node.",
+)
+parser.add_argument(
+    "--migration-address",
+    default="127.0.0.1:0",
+    metavar="HOST:PORT",
+    dest="migration_address",
+    help="Address the migration server listens on (default: a free port on \
+localhost)",
+)
+parser.add_argument(
+    "--migration-interval",
+    type=int,
+    default=5,
+    dest="migration_interval",
+    help="Generations between migrations (default: 5)",
+)
+parser.add_argument(
+    "--migrants",
+    type=int,
+    default=2,
+    help="Number of top genomes each island offers per migration \
+(default: 2)",
+)
+parser.add_argument(
+    "--authkey",
+    help="Shared secret for connecting to the migration server, required \
+with --join\n(default: a random key printed by the run started with \
+--islands)",
+)
+parser.add_argument(
+    "--spectate",
+    action="store_true",
+    help="Train as fast as possible on a separate thread while the window \
+shows the latest\nstate of the game at the normal frame rate.",
+)
+parser.add_argument(
+    "--config",
+    default="./neat_config",
+    help="Path to the NEAT configuration file (default: ./neat_config)",
+)
+parser.add_argument(
+    "--generations",
+    type=int,
+    default=200,
+    help="Maximum number of generations to train for (default: 200)",
+)
+parser.add_argument(
+    "--summary",
+    help="Write the number of generations trained, whether the fitness \
+threshold was reached\nand the best fitness to this JSON file.",
+)
+parser.add_argument(
+    "--memory-report",
+    dest="memory_report",
+    help="Trace memory during training and append a JSON line per \
+generation to this file\nwith the resident set size, traced memory and the \
+top allocation sites.",
+)
+parser.add_argument(
+    "--memory-budget",
+    type=float,
+    dest="memory_budget",
+    metavar="MB",
+    help="Save a checkpoint and stop training once the resident set size \
+goes over this\nmany megabytes.",
+)
+parser.add_argument(
+    "--restore",
+    metavar="CHECKPOINT",
+    help="Continue training from a checkpoint saved by --memory-budget",
+)
+parser.add_argument(
+    "--telemetry",
+    metavar="PATH",
+    help="Measure frame times, dropped frames and jump latency while playing \
+and append\nthem to this file as a JSON line per session (--type M only).",
+)
+parser.add_argument(
+    "--adaptive",
+    action="store_true",
+    help="Lower the frame rate the game is drawn at when frames take too \
+long to make.\nPlayed games keep running at the same speed, AI games \
+slow down.",
+)
+parser.add_argument(
+    "--archive",
+    metavar="FOLDER",
+    help="Folder of champion genomes. The best genome of every training run \
+is added to it.",
+)
+parser.add_argument(
+    "--warm-start",
+    type=int,
+    default=0,
+    dest="warm_start",
+    metavar="N",
+    help="Replace N genomes of the first generation with the fittest \
+genomes in the archive\nand report the speedup over cold runs \
+(default: 0, start from random genomes)",
+)
 args = parser.parse_args()
+if args.headless and args.mode != "AI":
+    parser.error("--headless is only supported with --type AI")
+if args.spectate and (args.mode != "AI" or args.headless):
+    parser.error("--spectate is only supported with --type AI")
+if args.adaptive and (args.headless or args.spectate):
+    parser.error("--adaptive is not supported with --headless or --spectate")
+if args.warm_start > 0 and args.archive is None:
+    parser.error("--warm-start requires --archive")
+if args.archive is not None and (
+    args.mode != "AI"
+    or args.islands > 0
+    or args.join is not None
+    or args.restore is not None
+):
+    parser.error("--archive is only supported when training a new population")
+if args.telemetry is not None and args.mode != "M":
+    parser.error("--telemetry is only supported with --type M")
+if (args.islands > 0 or args.join is not None) and not args.headless:
+    parser.error("--islands and --join require --headless")
+if args.join is not None and args.authkey is None:
+    parser.error("--join requires --authkey")
+if (
+    args.memory_report is not None
+    or args.memory_budget is not None
+    or args.restore is not None
+) and (args.mode != "AI" or args.islands > 0 or args.join is not None):
+    parser.error(
+        "--memory-report, --memory-budget and --restore are only supported "
+        "when training a single population"
+    )
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+if args.headless:
+    # A display mode is still needed to convert sprites, so use a dummy one
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
 import pygame
 
 # ╔──────────────────────────────────────────────────────────╗
@@ -54,19 +248,191 @@ create_table(
     username=username,
     password=password,
 )
+if args.mode == "AI":
+    create_training_tables(
+        username=username, password=password, database_name=DB_NAME
+    )
 
 # Set Width, Height and FPS for Game Window
 WIDTH = 800
 HEIGHT = 400
 FPS = 60
 
+
+class GameClock:
+    """GameClock Keeps track of the game time
+
+    In real time mode the clock waits on each tick to keep the frame rate.
+    In simulated mode ticks do not wait; every tick instead advances the game
+    time by exactly one frame, so games run as fast as possible while scores
+    stay the same as they would be in real time.
+    """
+
+    def __init__(self, simulated: bool = False) -> None:
+        """__init__ Creates a clock
+
+        Parameters
+        ----------
+        simulated : bool, optional
+            Whether the game time is simulated, by default False
+        """
+
+        self.simulated = simulated
+        self._clock = pygame.time.Clock()
+        self._ticks = 0.0
+
+    def tick(self, fps: int) -> int:
+        """tick Marks the start of a new frame
+
+        Parameters
+        ----------
+        fps : int
+            The target frame rate
+
+        Returns
+        -------
+        int
+            The number of milliseconds since the previous tick
+        """
+
+        if not self.simulated:
+            return self._clock.tick(fps)
+        self._ticks += 1000 / fps
+        return int(1000 / fps)
+
+    def advance(self, frames: int, fps: int) -> None:
+        """advance Moves a simulated clock forward by multiple frames
+
+        Parameters
+        ----------
+        frames : int
+            The number of frames to skip
+        fps : int
+            The target frame rate
+        """
+
+        # Added one frame at a time, so the time is exactly what it would have
+        # been after ticking through the frames
+        for _ in range(frames):
+            self._ticks += 1000 / fps
+
+    def frames_until(self, ticks: int, fps: int) -> int:
+        """frames_until Number of frames the clock can tick before a time
+
+        Parameters
+        ----------
+        ticks : int
+            The time in milliseconds
+        fps : int
+            The target frame rate
+
+        Returns
+        -------
+        int
+            The number of ticks after which `get_ticks` is still below
+            `ticks`. One frame is left out to allow for rounding, so the
+            time is never passed.
+        """
+
+        return max(math.floor((ticks - self._ticks) * fps / 1000) - 1, 0)
+
+    def get_rawtime(self) -> int:
+        """get_rawtime Returns the time spent working in the previous frame
+
+        Returns
+        -------
+        int
+            Milliseconds the previous frame took, not counting the time
+            `tick` waited to keep the frame rate
+        """
+
+        if not self.simulated:
+            return self._clock.get_rawtime()
+        return 0
+
+    def get_ticks(self) -> int:
+        """get_ticks Returns the current game time in milliseconds
+
+        Returns
+        -------
+        int
+            Milliseconds since the game started
+        """
+
+        if not self.simulated:
+            return pygame.time.get_ticks()
+        return int(self._ticks)
+
+
+class FramePacer:
+    """FramePacer Chooses the frame rate the game is drawn at
+
+    The rate starts at the full frame rate. When the time spent making each
+    frame no longer fits in a frame, the rate is lowered to the next whole
+    fraction of it, and raised again once there is room for the faster rate.
+    Physics are scaled by the time between frames, so the game keeps its
+    speed at any rate.
+    """
+
+    # The frame rate is the full rate divided by one of these
+    DIVISORS = (1, 2, 3, 4)
+    # Weight of the latest frame in the average work time
+    SMOOTHING = 0.1
+    # Fraction of a frame that may be spent working before the rate drops
+    HEADROOM = 0.9
+
+    def __init__(self, fps: int) -> None:
+        """__init__ Creates a pacer
+
+        Parameters
+        ----------
+        fps : int
+            The full frame rate
+        """
+
+        self.rates = [fps // divisor for divisor in self.DIVISORS]
+        self._level = 0
+        self._work = 0.0
+
+    @property
+    def rate(self) -> int:
+        """rate The frame rate to pass to `GameClock.tick`"""
+
+        return self.rates[self._level]
+
+    def update(self, work: int) -> None:
+        """update Adjusts the rate after a frame
+
+        Parameters
+        ----------
+        work : int
+            Milliseconds spent making the frame, see `GameClock.get_rawtime`
+        """
+
+        self._work += self.SMOOTHING * (work - self._work)
+        if (
+            self._work > self.HEADROOM * 1000 / self.rate
+            and self._level < len(self.rates) - 1
+        ):
+            self._level += 1
+        elif self._level > 0:
+            # Only go back up with room to spare, so the rate does not
+            # switch back and forth every frame
+            faster = self.rates[self._level - 1]
+            if self._work < self.HEADROOM / 2 * 1000 / faster:
+                self._level -= 1
+
+
 # The clock controls how many times the game refreshes per second
-clock = pygame.time.Clock()
+clock = GameClock(simulated=args.headless or args.spectate)
 
 # Setup the game window
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("AI Dino Run")
 
+# Scaled sprites are baked to disk, so only the first launch decodes them
+assets = AssetCache("./.asset_cache")
+
 
 # ╔──────────────────────────────────────────────────────────────╗
 # │  ____  _                          ___  _     _           _   │
@@ -115,8 +481,13 @@ class Player(pygame.sprite.Sprite):
     # Player Assets
 
     _run_sprites = []
+    _jump_sprite = None
+    _jump_mask = None
     _animation_state = 0
     _is_alive = True
+    # When the key press that started the current jump was polled, until the
+    # first frame showing the player off the ground has been drawn
+    jump_polled_at = None
 
     score = 0
 
@@ -138,31 +509,11 @@ class Player(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Load character sprites from ASSETS folder
-        run_assets_path = os.path.abspath(self.ASSETS_FOLDER + "/run")
-        # Sort player assets to ensure consistent ordering across runs
-        run_assets_files = sorted(os.listdir(run_assets_path))
-        for file in run_assets_files:
-            # Check if the asset selected is an image
-            if not file.endswith(".png"):
-                continue
-            # Get the full path to each asset
-            file_path = os.path.join(run_assets_path, file)
-            if not os.path.isfile(file_path):
-                continue
-            # Load the sprite and set the scale
-            img = pygame.transform.scale_by(
-                pygame.image.load(file_path).convert_alpha(),
-                self.PLAYER_SCALE,
-            )
-            # Append individual sprite frames to a list
-            self._run_sprites.append(img)
-
+        # Sprites are loaded by the first player and shared by all players
+        if Player._jump_sprite is None:
+            Player._load_sprites()
         # Set the sprite used during jumping
-        self.jump_sprite = pygame.transform.scale_by(
-            pygame.image.load("./Assets/Player/jump.png").convert_alpha(),
-            self.PLAYER_SCALE,
-        )
+        self.jump_sprite = self._jump_sprite
         # Players position vector created based on initial coordinates
         self.position = pygame.math.Vector2(x, y)
         # Players acceleration vector
@@ -175,13 +526,44 @@ class Player(pygame.sprite.Sprite):
         self.START_TICK = start_tick
         # Initialize the default sprite of the player as the jumping sprite
         self.image = self.jump_sprite
-        # Create a mask from the sprite of player
-        # The mask is used to calculate collisions
-        self.mask = pygame.mask.from_surface(self.image)
+        # The mask of the jumping sprite is used to calculate collisions
+        self.mask = self._jump_mask
         # Set the location of player's sprite at the provided coordinates
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.obstacle_handler = obstacle_handler
 
+    @staticmethod
+    def _load_sprites() -> None:
+        """_load_sprites Loads the sprites shared by all players
+
+        Called once, when the first player is created.
+        """
+
+        # Load character sprites from ASSETS folder
+        run_assets_path = os.path.abspath(Player.ASSETS_FOLDER + "/run")
+        # Sort player assets to ensure consistent ordering across runs
+        run_assets_files = sorted(os.listdir(run_assets_path))
+        for file in run_assets_files:
+            # Check if the asset selected is an image
+            if not file.endswith(".png"):
+                continue
+            # Get the full path to each asset
+            file_path = os.path.join(run_assets_path, file)
+            if not os.path.isfile(file_path):
+                continue
+            # Load the sprite and set the scale
+            img = assets.image(
+                file_path, scale=Player.PLAYER_SCALE
+            ).convert_alpha()
+            # Append individual sprite frames to a list
+            Player._run_sprites.append(img)
+
+        Player._jump_sprite = assets.image(
+            "./Assets/Player/jump.png", scale=Player.PLAYER_SCALE
+        ).convert_alpha()
+        # Create a mask from the sprite of player
+        Player._jump_mask = pygame.mask.from_surface(Player._jump_sprite)
+
     def on_ground(self) -> bool:
         """on_ground Determines whether the player is on the ground.
 
@@ -223,7 +605,8 @@ class Player(pygame.sprite.Sprite):
         # Gets all keys pressed
         pressedKeys = pygame.key.get_pressed()
         # Handle each key action
-        if pressedKeys[pygame.K_SPACE]:
+        if pressedKeys[pygame.K_SPACE] and self.on_ground():
+            self.jump_polled_at = time.perf_counter()
             self.jump()
 
     def _set_position(self) -> None:
@@ -247,12 +630,17 @@ class Player(pygame.sprite.Sprite):
         self._is_alive = False
         self._calculate_score()
 
-    def update_animation_state(self) -> None:
+    def update_animation_state(self, dt: float = 1) -> None:
         """update_animation_state is called to set the new sprite for the
         player.
 
         This function is called each new frame to calculate what sprite is
         used for the player.
+
+        Parameters
+        ----------
+        dt : float, optional
+            The time since the previous frame, in frames, by default 1
         """
 
         ON_GROUND = self.on_ground()
@@ -260,26 +648,121 @@ class Player(pygame.sprite.Sprite):
             self._animation_state = 0
             self.image = self.jump_sprite
             return
-        self._animation_state += self.ANIMATION_SPEED
+        self._animation_state += self.ANIMATION_SPEED * dt
         ANIMATION_ENDED = self._animation_state >= len(self._run_sprites)
         if ANIMATION_ENDED:
             self._animation_state = 0
         self.image = self._run_sprites[int(self._animation_state)]
 
-    def move(self) -> None:
+    def move(self, dt: float = 1) -> None:
         """move is called to recalculate the player's position
 
         The function is called to calculate the player's new vertical position.
+        The acceleration is constant during a step, so the position is exact
+        for any step length and a jump follows the same arc at any frame rate.
+
+        Parameters
+        ----------
+        dt : float, optional
+            The time since the previous frame, in frames, by default 1
         """
 
-        self.position += self.velocity + 0.5 * self.acceleration
-        self.velocity += self.acceleration
+        self.position += self.velocity * dt + 0.5 * self.acceleration * dt**2
+        self.velocity += self.acceleration * dt
         BELOW_GROUND = self.position.y > self.GROUND_HEIGHT
         if BELOW_GROUND:
             self.acceleration.y = 0
             self.velocity.y = 0
             self.position.y = self.GROUND_HEIGHT
 
+    def frames_until_landing(self) -> int:
+        """frames_until_landing Calculates when a jump ends
+
+        Under constant gravity the position after `n` frames is
+        `y + n * v + n ** 2 * g / 2`, which is solved for the first frame that
+        takes the player below the ground.
+
+        Returns
+        -------
+        int
+            The number of calls to `move` before the player lands, or 0 if
+            the player is on the ground
+        """
+
+        if self.on_ground():
+            return 0
+        height = self.GROUND_HEIGHT - self.position.y
+        velocity = self.velocity.y
+        gravity = self.acceleration.y
+        if gravity == 0:
+            return 0
+        return (
+            math.floor(
+                (-velocity + math.sqrt(velocity**2 + 2 * gravity * height))
+                / gravity
+            )
+            + 1
+        )
+
+    def frames_until_event(self, limit: int) -> int:
+        """frames_until_event Number of upcoming frames that can be skipped
+
+        A frame can be skipped when the result of the frame for this player
+        can be calculated in advance with `fast_forward`. Input from a user
+        cannot be predicted, so a user controlled player never allows it.
+
+        Parameters
+        ----------
+        limit : int
+            The most frames that are skipped. No obstacle can reach the
+            player and no obstacle spawns in that many frames.
+
+        Returns
+        -------
+        int
+            The number of frames that can be skipped, at most `limit`
+        """
+
+        return 0
+
+    def fast_forward(self, frames: int) -> None:
+        """fast_forward Skips the player ahead by a number of frames
+
+        Gives the same result as calling `update` for each frame, as long as
+        the player does not jump or land during those frames.
+
+        Parameters
+        ----------
+        frames : int
+            The number of frames to skip
+        """
+
+        if not self._is_alive:
+            return
+        if self.on_ground():
+            sprite_count = len(self._run_sprites)
+            # Frames until the animation wraps from the current sprite, and
+            # the length of a full animation cycle after wrapping
+            until_wrap = math.ceil(
+                (sprite_count - self._animation_state) / self.ANIMATION_SPEED
+            )
+            if frames < until_wrap:
+                self._animation_state += frames * self.ANIMATION_SPEED
+            else:
+                cycle = math.ceil(sprite_count / self.ANIMATION_SPEED)
+                self._animation_state = (
+                    (frames - until_wrap) % cycle
+                ) * self.ANIMATION_SPEED
+            self.image = self._run_sprites[int(self._animation_state)]
+        else:
+            self.position.y += (
+                frames * self.velocity.y
+                + 0.5 * self.acceleration.y * frames**2
+            )
+            self.velocity.y += frames * self.acceleration.y
+        self._set_position()
+        self._calculate_score()
+
     def _calculate_score(self) -> None:
         """_calculate_score calculates the score of the player
 
@@ -287,18 +770,23 @@ class Player(pygame.sprite.Sprite):
         performance of the player
         """
 
-        self.score = int((pygame.time.get_ticks() - self.START_TICK) / 100)
+        self.score = int((clock.get_ticks() - self.START_TICK) / 100)
 
-    def update(self, *args: Any, **kwargs: Any) -> None:
+    def update(self, dt: float = 1, *args: Any, **kwargs: Any) -> None:
         """update is called every frame, and handles making player updates.
 
         This function is called every new frame. All updates to player are
         calculated and handled when from this function call
+
+        Parameters
+        ----------
+        dt : float, optional
+            The time since the previous frame, in frames, by default 1
         """
 
         if self._is_alive:
-            self.update_animation_state()
-            self.move()
+            self.update_animation_state(dt)
+            self.move(dt)
             self._handle_input()
             self._set_position()
             self._calculate_score()
@@ -319,10 +807,20 @@ class Obstacle(pygame.sprite.Sprite):
     This class handles updating the position of the obstacle.
     And handle object deletion after the object is off-screen.
 
+    Obstacles are pooled by the `ObstacleHandler`; an instance that leaves
+    the screen is only removed from its groups and is later placed back at
+    the spawn point with `reset`.
+
     """
 
     def __init__(
-        self, img: pygame.surface.Surface, x: int, y: int, speed: int
+        self,
+        img: pygame.surface.Surface,
+        mask: pygame.mask.Mask,
+        x: int,
+        y: int,
+        speed: int,
+        index: int = 0,
     ):
         """__init__ Creates an obstacle
 
@@ -332,6 +830,8 @@ class Obstacle(pygame.sprite.Sprite):
         ----------
         img : pygame.surface.Surface
             The image used for the obstacle
+        mask : pygame.mask.Mask
+            The collision mask of `img`
         x : int
             Initial spawn x of the obstacle
         y : int
@@ -339,33 +839,72 @@ class Obstacle(pygame.sprite.Sprite):
         speed : int
             The speed at which the obstacle moves towards the left of the
             screen
+        index : int, optional
+            The index of `img` in the obstacle sprites, by default 0
+        """
+
+        self.speed = speed
+        self.rect = img.get_rect()
+        self.reset(img, mask, x, y, index)
+        super().__init__()
+
+    def reset(
+        self,
+        img: pygame.surface.Surface,
+        mask: pygame.mask.Mask,
+        x: int,
+        y: int,
+        index: int = 0,
+    ) -> None:
+        """reset Places the obstacle at a new position with a new sprite
+
+        Used to reuse a pooled obstacle instead of creating a new one.
+
+        Parameters
+        ----------
+        img : pygame.surface.Surface
+            The image used for the obstacle
+        mask : pygame.mask.Mask
+            The collision mask of `img`
+        x : int
+            Spawn x of the obstacle
+        y : int
+            Spawn y of the obstacle
+        index : int, optional
+            The index of `img` in the obstacle sprites, used to look up
+            collisions, by default 0
         """
 
         self.image = img
+        self.mask = mask
+        self.index = index
         self.x = x
         self.y = y
-        self.speed = speed
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = img.get_rect(midbottom=(x, y))
-        super().__init__()
+        # Resize and move the existing rect rather than creating a new one
+        self.rect.size = img.get_size()
+        self.rect.midbottom = (x, y)
 
-    def update(self, *args: Any, **kwargs: Any) -> None:
+    def update(self, dt: float = 1, *args: Any, **kwargs: Any) -> None:
         """update Handles updates to the obstacle each frame
 
         This function is called each time the screen is updated.
         Updates to obstacle properties are made within this function.
 
+        Parameters
+        ----------
+        dt : float, optional
+            The time since the previous frame, in frames, by default 1
         """
 
         # Check if the obstacle outside the screen area
-        # If the obstacle is outside the screen, destroy the object
+        # If the obstacle is outside the screen, release it back to the pool
         OBSTACLE_OFF_SCREEN = self.rect.bottomright[0] < 0
         if OBSTACLE_OFF_SCREEN:
             return self.kill()
         # Calculate the new position of the obstacle
-        self.x -= self.speed
+        self.x -= self.speed * dt
         # Update the position of the obstacle
-        self.rect = self.image.get_rect(midbottom=(self.x, self.y))
+        self.rect.midbottom = (self.x, self.y)
 
 
 # ╔───────────────────────────────────────╗
@@ -402,6 +941,15 @@ class ObstacleHandler:
     OBSTACLE_SPAWN_PERCENTAGE : int
         The percentage chance that an obstacle is generated each frame as long
         as `OFFSET` is maintained.
+    COURSE_FRAMES : int
+        The number of frames covered by courses made with `make_course`
+        before they repeat.
+    pool : List[Obstacle]
+        Preallocated obstacles reused as a ring buffer. It holds enough slots
+        for the most obstacles that can be on screen at once given `OFFSET`.
+    course : CourseTape
+        The pre-generated course obstacles are spawned from. When `None`
+        obstacles are spawned at random.
     """
 
     ASSETS_FOLDER = "./Assets/Obstacles"
@@ -409,6 +957,7 @@ class ObstacleHandler:
     OBSTACLE_SPEED = 5
     OFFSET = 50
     OBSTACLE_SPAWN_PERCENTAGE = 0.97
+    COURSE_FRAMES = 36000
 
     def __init__(self):
         """__init__ This function is used to create a handler for all obstacles
@@ -426,57 +975,263 @@ class ObstacleHandler:
             file_path = os.path.join(self.ASSETS_FOLDER, file)
             if not (os.path.isfile(file_path) and file_path.endswith(".png")):
                 continue
-            img = pygame.transform.scale_by(
-                pygame.image.load(file_path).convert_alpha(), 0.2
-            )
+            img = assets.image(file_path, scale=0.2).convert_alpha()
             self.sprites.append(img)
+        # Masks are computed once per sprite and shared by every obstacle
+        self.masks = [pygame.mask.from_surface(img) for img in self.sprites]
         self.obstacles = pygame.sprite.Group()
 
+        # Successive obstacles are at least `min_gap` pixels apart, so no more
+        # than `pool_size` obstacles can be on screen at the same time
+        min_gap = (
+            Player.TIME_OF_JUMP * self.OBSTACLE_SPEED
+            + min(img.get_width() for img in self.sprites)
+            + self.OFFSET
+        )
+        max_width = max(img.get_width() for img in self.sprites)
+        pool_size = (
+            math.ceil((self.OBSTACLE_SPAWN_X + max_width) / min_gap) + 1
+        )
+        self.pool = [
+            Obstacle(
+                self.sprites[0],
+                self.masks[0],
+                self.OBSTACLE_SPAWN_X,
+                0,
+                self.OBSTACLE_SPEED,
+            )
+            for _ in range(pool_size)
+        ]
+        self._next_slot = 0
+        self.course = None
+        # Frames that have passed and the next spawn to take from the course
+        self.frame = 0
+        self._spawn_number = 0
+        # Frame of the next random spawn attempt, picked on the first frame
+        self._next_attempt = None
+
     def set_ground_height(self, ground_height) -> None:
         self.GROUND_HEIGHT = ground_height
 
-    def get_closest(self) -> int:
-        closest = self.OBSTACLE_SPAWN_X
-        for obstacle in self.obstacles.sprites():
-            if (
-                closest > obstacle.rect.bottomleft[0] - 80
-                and obstacle.rect.bottomleft[0] > 80
-            ):
-                closest = obstacle.rect.bottomleft[0] - 80
-        return closest
+    def set_course(self, course: CourseTape) -> None:
+        """set_course Spawns obstacles from a pre-generated course
 
-    def generate(self) -> None:
-        """generate is called to create a new obstacle.
+        Parameters
+        ----------
+        course : CourseTape
+            The course to follow from its start
+        """
 
-        This function is called every time a new obstacle is needed.
-        The function only creates a new obstacle if able to do so.
+        self.course = course
+        self._spawn_number = 0
+
+    def make_course(self, seed: int) -> CourseTape:
+        """make_course Generates a course for the obstacle sprites
+
+        Parameters
+        ----------
+        seed : int
+            Seed used to generate the course
+
+        Returns
+        -------
+        CourseTape
+            A course covering `COURSE_FRAMES` frames
         """
 
-        if random.random() < self.OBSTACLE_SPAWN_PERCENTAGE:
-            return
-        air_time = Player.TIME_OF_JUMP
-        furthest_distance = 0
-        for obstacle in self.obstacles.sprites():
-            if furthest_distance < obstacle.x:
-                furthest_distance = obstacle.x
-        obstacle = random.choice(self.sprites)
-        gap_between_obstacles = self.OBSTACLE_SPAWN_X - furthest_distance
-        distance_traveled_in_air = (
-            air_time * self.OBSTACLE_SPEED + obstacle.get_width()
-        )
-        if not (
-            gap_between_obstacles > distance_traveled_in_air + self.OFFSET
-        ):
-            return
-        self.obstacles.add(
-            Obstacle(
-                obstacle,
-                self.OBSTACLE_SPAWN_X,
-                self.GROUND_HEIGHT + 20,
-                self.OBSTACLE_SPEED,
-            )
+        gaps = [
+            Player.TIME_OF_JUMP * self.OBSTACLE_SPEED
+            + img.get_width()
+            + self.OFFSET
+            for img in self.sprites
+        ]
+        return CourseTape.generate(
+            seed,
+            self.COURSE_FRAMES,
+            gaps,
+            self.OBSTACLE_SPEED,
+            self.OBSTACLE_SPAWN_PERCENTAGE,
         )
 
+    def get_closest(self, frames: int = 0) -> int:
+        """get_closest Distance to the closest obstacle ahead of the players
+
+        Parameters
+        ----------
+        frames : int, optional
+            Gives the distance after obstacles have moved this many more
+            times, by default 0
+
+        Returns
+        -------
+        int
+            The distance, or the spawn point when no obstacle is ahead
+        """
+
+        closest = self.OBSTACLE_SPAWN_X
+        for obstacle in self.obstacles.sprites():
+            left = obstacle.rect.bottomleft[0] - frames * obstacle.speed
+            if closest > left - 80 and left > 80:
+                closest = left - 80
+        return closest
+
+    def frames_until_spawn(self) -> int:
+        """frames_until_spawn Number of frames before an obstacle can spawn
+
+        Returns
+        -------
+        int
+            The number of times obstacles move before `generate` can add an
+            obstacle, either from the course or on the next random attempt
+        """
+
+        if self.course is not None:
+            spawn_frame, _ = self.course.spawn(self._spawn_number)
+            return max(spawn_frame - self.frame, 0)
+        if self._next_attempt is None:
+            return 0
+        return max(math.ceil(self._next_attempt - self.frame), 0)
+
+    def _frames_until_fit(self) -> int:
+        """_frames_until_fit Number of frames before any sprite fits
+
+        A sprite only fits once the furthest obstacle has moved far enough
+        from the spawn point, which happens first for the narrowest sprite.
+
+        Returns
+        -------
+        int
+            The number of times obstacles move before the narrowest sprite
+            fits at the spawn point
+        """
+
+        if len(self.obstacles) == 0:
+            return 0
+        furthest_distance = max(obstacle.x for obstacle in self.obstacles)
+        required_gap = (
+            Player.TIME_OF_JUMP * self.OBSTACLE_SPEED
+            + min(img.get_width() for img in self.sprites)
+            + self.OFFSET
+        )
+        frames = (
+            math.floor(
+                (required_gap - self.OBSTACLE_SPAWN_X + furthest_distance)
+                / self.OBSTACLE_SPEED
+            )
+            + 1
+        )
+        return max(frames, 0)
+
+    def fast_forward(self, frames: int) -> None:
+        """fast_forward Moves all obstacles ahead by a number of frames
+
+        Parameters
+        ----------
+        frames : int
+            The number of frames to skip
+        """
+
+        self.frame += frames
+        for obstacle in self.obstacles.sprites():
+            obstacle.x -= frames * obstacle.speed
+            obstacle.rect.midbottom = (obstacle.x, obstacle.y)
+            if obstacle.rect.bottomright[0] < 0:
+                obstacle.kill()
+
+    def generate(self, dt: float = 1) -> None:
+        """generate is called to create a new obstacle.
+
+        This function is called every time a new obstacle is needed.
+        The function only creates a new obstacle if able to do so.
+
+        Parameters
+        ----------
+        dt : float, optional
+            The time since the previous frame, in frames, by default 1. A
+            longer step has the same chance of an obstacle as that many
+            frames.
+        """
+
+        frame = self.frame
+        self.frame += dt
+        if self.course is not None:
+            spawn_frame, index = self.course.spawn(self._spawn_number)
+            while spawn_frame < frame + dt:
+                self._spawn_number += 1
+                # An obstacle due part way through the step is placed where
+                # it would have been had it spawned on time
+                self._spawn(
+                    index,
+                    self.OBSTACLE_SPAWN_X
+                    - self.OBSTACLE_SPEED * (frame - spawn_frame),
+                )
+                spawn_frame, index = self.course.spawn(self._spawn_number)
+            return
+        # Attempts are only made on frames where a sprite can fit, and the
+        # frame of the next one is picked in advance, so nothing is done on
+        # frames without one
+        if self._next_attempt is None:
+            self._next_attempt = next_attempt(
+                random, frame, self.OBSTACLE_SPAWN_PERCENTAGE
+            )
+        while self._next_attempt < frame + dt:
+            attempt = self._next_attempt
+            air_time = Player.TIME_OF_JUMP
+            furthest_distance = 0
+            for obstacle in self.obstacles.sprites():
+                if furthest_distance < obstacle.x:
+                    furthest_distance = obstacle.x
+            index = random.randrange(len(self.sprites))
+            obstacle = self.sprites[index]
+            # Obstacles have moved on by the time of an attempt part way
+            # through the step
+            gap_between_obstacles = (
+                self.OBSTACLE_SPAWN_X
+                - furthest_distance
+                + self.OBSTACLE_SPEED * (attempt - frame)
+            )
+            distance_traveled_in_air = (
+                air_time * self.OBSTACLE_SPEED + obstacle.get_width()
+            )
+            if gap_between_obstacles > distance_traveled_in_air + self.OFFSET:
+                self._spawn(
+                    index,
+                    self.OBSTACLE_SPAWN_X
+                    - self.OBSTACLE_SPEED * (frame - attempt),
+                )
+            self._next_attempt = next_attempt(
+                random,
+                max(attempt + 1, frame + self._frames_until_fit()),
+                self.OBSTACLE_SPAWN_PERCENTAGE,
+            )
+
+    def _spawn(self, index: int, x: Optional[float] = None) -> None:
+        """_spawn Places an obstacle at the spawn point
+
+        Parameters
+        ----------
+        index : int
+            The index of the sprite used for the obstacle
+        x : float, optional
+            The x position to place the obstacle at, by default the spawn
+            point
+        """
+
+        # Take the oldest slot of the ring buffer. It has always left the
+        # screen by now, but never overwrite an obstacle still in play.
+        slot = self.pool[self._next_slot]
+        if slot.alive():
+            return
+        self._next_slot = (self._next_slot + 1) % len(self.pool)
+        slot.reset(
+            self.sprites[index],
+            self.masks[index],
+            self.OBSTACLE_SPAWN_X if x is None else x,
+            self.GROUND_HEIGHT + 20,
+            index,
+        )
+        self.obstacles.add(slot)
+
 
 # ╔─────────────────────────────╗
 # │   ____                      │
@@ -486,15 +1241,118 @@ class ObstacleHandler:
 # │  \____|\__,_|_| |_| |_|\___|│
 # │                             │
 # ╚─────────────────────────────╝
+class CollisionTable:
+    """CollisionTable Precomputed collisions between players and obstacles
+
+    Players always collide with the mask of their jumping sprite, so whether
+    a player hits an obstacle only depends on the obstacle sprite and the
+    offset between their rects. The overlap of the masks is calculated once
+    for every offset at which they can touch, and collisions are then looked
+    up instead of comparing masks each frame. Lookups give exactly the same
+    result as `pygame.sprite.collide_mask`.
+    """
+
+    def __init__(
+        self, player_mask: pygame.mask.Mask, masks: List[pygame.mask.Mask]
+    ) -> None:
+        """__init__ Calculates the collisions of every obstacle sprite
+
+        Parameters
+        ----------
+        player_mask : pygame.mask.Mask
+            The mask players collide with
+        masks : List[pygame.mask.Mask]
+            The mask of each obstacle sprite
+        """
+
+        player_width, player_height = player_mask.get_size()
+        self.tables = []
+        for mask in masks:
+            width, height = mask.get_size()
+            # Offsets outside of these ranges can never overlap
+            xs = range(1 - width, player_width)
+            ys = range(1 - height, player_height)
+            table = bytes(
+                player_mask.overlap(mask, (x, y)) is not None
+                for x in xs
+                for y in ys
+            )
+            self.tables.append((table, xs, ys))
+
+    def collides(self, player: Player, obstacle: Obstacle) -> bool:
+        """collides Checks whether a player hits an obstacle
+
+        Parameters
+        ----------
+        player : Player
+            The player
+        obstacle : Obstacle
+            The obstacle
+
+        Returns
+        -------
+        bool
+            Whether the masks of the player and the obstacle overlap
+        """
+
+        table, xs, ys = self.tables[obstacle.index]
+        x = obstacle.rect.x - player.rect.x
+        y = obstacle.rect.y - player.rect.y
+        if x not in xs or y not in ys:
+            return False
+        return table[(x - xs.start) * len(ys) + y - ys.start] == 1
+
+
+class Snapshot(NamedTuple):
+    """Snapshot Everything needed to draw one frame of a game
+
+    Attributes
+    ----------
+    runners : List[Tuple[pygame.surface.Surface, pygame.Rect]]
+        The image and position of each player drawn
+    obstacles : List[Tuple[pygame.surface.Surface, pygame.Rect]]
+        The image and position of each obstacle
+    score : int
+        The score shown in the corner of the screen
+    alive : int
+        The number of players still in the game, including those not drawn
+    total : int
+        The number of players the game started with
+    """
+
+    runners: List[Tuple[pygame.surface.Surface, pygame.Rect]]
+    obstacles: List[Tuple[pygame.surface.Surface, pygame.Rect]]
+    score: int
+    alive: int
+    total: int
+
+
 class Game:
     """An instance of a game.
 
     This class handles running one instance of a game.
+
+    Attributes
+    ----------
+    DRAWN_RUNNERS : int
+        The most players drawn each frame. The players with the highest score
+        are drawn, the rest are only counted in a bar at the top of the
+        screen, so drawing costs the same however many players there are.
+    MAX_STEP : float
+        The longest time in frames the game moves forward in one frame. When
+        frames take longer, for example while the window is dragged, the game
+        slows down instead of jumping ahead. It leaves room for late frames at
+        the slowest rate of the `FramePacer`, so adaptive pacing never slows
+        the game. Long steps are split into steps of at most one frame, so
+        obstacles can not pass through the players.
     """
 
-    sky = pygame.transform.scale(
-        pygame.image.load("Assets/desert_BG.png"), (800, 400)
-    )
+    DRAWN_RUNNERS = 5
+    MAX_STEP = 1.5 * max(FramePacer.DIVISORS)
+    # Shared by every game, the sprites never change while running
+    _collisions = None
+
+    sky = assets.image("Assets/desert_BG.png", size=(800, 400)).convert_alpha()
     font = pygame.font.Font(None, 30)
 
     def __init__(
@@ -526,13 +1384,38 @@ class Game:
         self.characterGroup = pygame.sprite.Group()
         self.players = player
         self.characterGroup.add(self.players)
-
-    def run_multiple(self):
+        if Game._collisions is None:
+            Game._collisions = CollisionTable(
+                Player._jump_mask, self.obstacleHandler.masks
+            )
+        # Set when the game is simulated on another thread and watched
+        self.spectator = None
+        # Set to measure frame times and input latency
+        self.telemetry = None
+        # Set to lower the frame rate when frames take too long
+        self.pacer = None
+        # Set to move by the time frames take instead of one frame per tick,
+        # only a person playing needs the game to keep to real time
+        self.variable_step = False
+        self._stop_requested = False
+
+    def stop(self) -> None:
+        """stop Ends the game at the start of its next frame"""
+
+        self._stop_requested = True
+
+    def run_multiple(self, max_score: Optional[int] = None):
         """run runs the game
 
         This function starts a blocking game loop that terminates when the
         player dies.
 
+        Parameters
+        ----------
+        max_score : int, optional
+            Ends the game once every player still alive has reached this
+            score, by default None (the game only ends when all players die)
+
         Returns
         -------
         int
@@ -541,59 +1424,246 @@ class Game:
         pygame.key.set_repeat(100)
         alive = list(self.players)
         dead = []
-        while len(alive) > 0:
-            clock.tick(FPS)
-            for event in pygame.event.get():
+        while len(alive) > 0 and not self._stop_requested:
+            if max_score is not None and all(
+                player.score >= max_score for player in alive
+            ):
+                break
+            # Nothing is drawn without a screen, so uneventful frames can be
+            # skipped instead of simulated one at a time
+            if self.screen is None:
+                self._skip_to_next_event(alive, max_score)
+            rate = FPS if self.pacer is None else self.pacer.rate
+            elapsed = clock.tick(rate)
+            # The AI decides once per frame, so its games always move one
+            # frame at a time, a person playing moves by the time that passed
+            if clock.simulated or not self.variable_step:
+                dt = 1
+            else:
+                dt = min(elapsed * FPS / 1000, self.MAX_STEP)
+            if self.pacer is not None:
+                self.pacer.update(clock.get_rawtime())
+            if self.telemetry is not None:
+                self.telemetry.frame()
+            # Events can only be read on the main thread, a spectator handles
+            # them when the game runs on another one
+            for event in [] if self.spectator else pygame.event.get():
                 if event.type == pygame.QUIT:
                     return [player.score for player in self.players]
-            for i, player in enumerate(alive):
-                if pygame.sprite.spritecollide(
-                    player,
-                    self.obstacleHandler.obstacles,
-                    False,
-                    pygame.sprite.collide_mask,  # type: ignore
-                ):
-                    player.game_over()
-                    self.characterGroup.remove(player)
-                    dead.append(alive.pop(i))
-            self.characterGroup.update()
-            self.obstacleHandler.generate()
-            self.obstacleHandler.obstacles.update()
-            scores = [player.score for player in alive]
+            # Obstacles never move further between two collision checks than
+            # they do in a single frame, however long the step is
+            steps = math.ceil(dt)
+            step = dt if steps == 1 else dt / steps
+            for _ in range(steps):
+                self._step(alive, dead, step)
             if self.screen is not None:
-                self.screen.blit(self.sky, (0, 0))
-                self.characterGroup.draw(self.screen)
-                self.obstacleHandler.obstacles.draw(self.screen)
-                score_rect = self.font.render(
-                    f"Score: {scores[0] if len(scores) > 0 else 0}",
-                    False,
-                    "Red",
-                )
-                self.screen.blit(
-                    score_rect, score_rect.get_rect(topright=(WIDTH - 10, 10))
-                )
-            pygame.display.update()
+                self.draw(self.screen, self.snapshot(alive))
+                pygame.display.update()
+                if self.telemetry is not None:
+                    for player in alive:
+                        # The jump starts moving the player on the frame
+                        # after the key press was polled
+                        if (
+                            player.jump_polled_at is not None
+                            and not player.on_ground()
+                        ):
+                            self.telemetry.presented(player.jump_polled_at)
+                            player.jump_polled_at = None
+            elif self.spectator is not None and self.spectator.waiting():
+                self.spectator.publish(self.snapshot(alive))
         return [player.score for player in self.players]
 
-    def scoreboard(self, scores: List[tuple[str, int]]):
+    def _step(self, alive: List[Player], dead: List[Player], dt: float):
+        """_step Checks for collisions and moves the game forward
+
+        Parameters
+        ----------
+        alive : List[Player]
+            The players still in the game, players that collide are moved
+            from it to `dead`
+        dead : List[Player]
+            The players that are out of the game
+        dt : float
+            The time in frames to move forward, at most one frame
+        """
+
+        obstacles = self.obstacleHandler.obstacles.sprites()
+        for i, player in enumerate(alive):
+            if any(
+                self._collisions.collides(player, obstacle)
+                for obstacle in obstacles
+            ):
+                player.game_over()
+                self.characterGroup.remove(player)
+                dead.append(alive.pop(i))
+        self.characterGroup.update(dt)
+        self.obstacleHandler.generate(dt)
+        self.obstacleHandler.obstacles.update(dt)
+
+    def snapshot(self, alive: List[Player]) -> Snapshot:
+        """snapshot Captures what the current frame looks like
+
+        Parameters
+        ----------
+        alive : List[Player]
+            The players still in the game
+
+        Returns
+        -------
+        Snapshot
+            A copy of the positions, so it stays valid while the game goes on
+        """
+
+        drawn = heapq.nlargest(
+            self.DRAWN_RUNNERS, alive, key=lambda player: player.score
+        )
+        return Snapshot(
+            runners=[(player.image, player.rect.copy()) for player in drawn],
+            obstacles=[
+                (obstacle.image, obstacle.rect.copy())
+                for obstacle in self.obstacleHandler.obstacles.sprites()
+            ],
+            score=drawn[0].score if len(drawn) > 0 else 0,
+            alive=len(alive),
+            total=len(self.players),
+        )
+
+    def draw(self, screen: pygame.surface.Surface, snapshot: Snapshot) -> None:
+        """draw Draws a frame of the game
+
+        Parameters
+        ----------
+        screen : pygame.surface.Surface
+            The surface to draw on
+        snapshot : Snapshot
+            The frame to draw
+        """
+
+        screen.blit(self.sky, (0, 0))
+        screen.blits(snapshot.runners, doreturn=False)
+        screen.blits(snapshot.obstacles, doreturn=False)
+        score_rect = self.font.render(f"Score: {snapshot.score}", False, "Red")
+        screen.blit(score_rect, score_rect.get_rect(topright=(WIDTH - 10, 10)))
+        hidden = snapshot.alive - len(snapshot.runners)
+        if hidden > 0:
+            # Share of the starting players still alive, with the number of
+            # players that are alive but not drawn
+            bar = pygame.Rect(10, 10, 200, 20)
+            pygame.draw.rect(screen, "Gray", bar)
+            bar.width = int(bar.width * snapshot.alive / snapshot.total)
+            pygame.draw.rect(screen, "Red", bar)
+            count_rect = self.font.render(f"+{hidden} more", False, "Red")
+            screen.blit(count_rect, count_rect.get_rect(topleft=(220, 10)))
+
+    def _skip_to_next_event(
+        self, alive: List[Player], max_score: Optional[int] = None
+    ) -> None:
+        """_skip_to_next_event Skips frames in which nothing can happen
+
+        A frame can be skipped when no obstacle is close enough to touch a
+        player, no obstacle can spawn, no player will jump or land and the
+        game does not end. Obstacles approaching the players are skipped over
+        as well. Positions and scores are then moved forward up to the next
+        frame where one of those events can happen.
+
+        Parameters
+        ----------
+        alive : List[Player]
+            The players still in the game
+        max_score : int, optional
+            The score at which the game ends, by default None
+        """
+
+        frames = min(
+            self.obstacleHandler.frames_until_spawn(),
+            self._frames_until_reach(alive),
+        )
+        if max_score is not None:
+            # The game ends after the frame in which the lowest score of the
+            # players reaches `max_score`, that frame is simulated in full
+            start = max(player.START_TICK for player in alive)
+            frames = min(
+                frames, clock.frames_until(start + 100 * max_score, FPS)
+            )
+        for player in alive:
+            if frames <= 0:
+                return
+            frames = min(frames, player.frames_until_event(frames))
+        if frames <= 0:
+            return
+        clock.advance(frames, FPS)
+        for player in alive:
+            player.fast_forward(frames)
+        self.obstacleHandler.fast_forward(frames)
+
+    def _frames_until_reach(self, alive: List[Player]) -> int:
+        """_frames_until_reach Number of frames before an obstacle can collide
+
+        Uses the offsets at which the collision tables can report a hit, for
+        every sprite the players can show while frames are skipped.
+
+        Parameters
+        ----------
+        alive : List[Player]
+            The players still in the game
+
+        Returns
+        -------
+        int
+            The number of times obstacles can move without any of them
+            touching a player, 0 if one can touch a player now
+        """
+
+        images = Player._run_sprites + [Player._jump_sprite]
+        lefts = [
+            image.get_rect(midbottom=player.rect.midbottom).x
+            for player in alive
+            for image in images
+        ]
+        frames = math.inf
+        for obstacle in self.obstacleHandler.obstacles.sprites():
+            _, xs, _ = self._collisions.tables[obstacle.index]
+            if obstacle.rect.x < min(lefts) + xs.start:
+                # Passed every player, obstacles only move further away
+                continue
+            reach = max(lefts) + xs.stop - 1
+            if obstacle.rect.x <= reach:
+                return 0
+            frames = min(
+                frames, math.ceil((obstacle.rect.x - reach) / obstacle.speed)
+            )
+        return frames
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _render_score(name: str, score: int) -> pygame.surface.Surface:
+        """_render_score Renders a row of the scoreboard
+
+        Recently shown rows are cached, so paging back and forth does not
+        render the same text again.
+        """
+
+        return Game.font.render(f"{name} - {score}", True, "Red")
+
+    def scoreboard(self, fetch_page: Callable[..., List[tuple]]):
         """scoreboard displays the scoreboard
 
-        Displays the scoreboard on the screen provided to the `game` class
+        Displays the scoreboard on the screen provided to the `game` class.
+        Only the page on screen is kept in memory; the next or previous page
+        is fetched when the user moves to it.
 
         Parameters
         ----------
-        scores : List[tuple[str, int]]
-            A list of tuples in the format `(name, score)` retrieved from
-            database
+        fetch_page : Callable[..., List[tuple]]
+            Called with `size` and optionally `after` or `before` as in
+            `SqlHelper.scores_page`, returns rows in the format
+            `(id, name, score)` retrieved from database
         """
 
-        index = 0
-        background = pygame.image.load("Assets/scoreboard.png")
+        PAGE_SIZE = 3
+        background = assets.image("Assets/scoreboard.png").convert_alpha()
         text_x: int = 245
-        score_rects = [
-            self.font.render(f"{score[0]} - {score[1]}", True, "Red")
-            for score in scores
-        ]
+        page = fetch_page(size=PAGE_SIZE)
 
         while True:
             text_y: int = 135
@@ -604,19 +1674,30 @@ class Game:
                     case pygame.MOUSEBUTTONDOWN:
                         x, y = pygame.mouse.get_pos()
                         if (10 <= x <= 66) and (340 <= y <= 383):
-                            if 0 <= index - 3:
-                                index -= 3
+                            if len(page) > 0:
+                                first_id, _, first_score = page[0]
+                                previous_page = fetch_page(
+                                    size=PAGE_SIZE,
+                                    before=(first_score, first_id),
+                                )
+                                if len(previous_page) > 0:
+                                    page = previous_page
                         elif (10 <= x <= 66) and (25 <= y <= 68):
                             print("Return to main menu")
                         elif (730 <= x <= 785) and (340 <= y <= 383):
-                            if index + 3 < len(score_rects):
-                                print("test")
-                                index += 3
+                            if len(page) == PAGE_SIZE:
+                                last_id, _, last_score = page[-1]
+                                next_page = fetch_page(
+                                    size=PAGE_SIZE,
+                                    after=(last_score, last_id),
+                                )
+                                if len(next_page) > 0:
+                                    page = next_page
 
             clock.tick(FPS)
             self.screen.blit(background, (0, 0))
-            scores_to_display = score_rects[index : index + 3]
-            for score_rect in scores_to_display:
+            for _, name, score in page:
+                score_rect = self._render_score(name, score)
                 self.screen.blit(
                     score_rect,
                     score_rect.get_rect(bottomleft=(text_x, text_y)),
@@ -625,7 +1706,94 @@ class Game:
             pygame.display.update()
 
 
+class Spectator:
+    """Spectator Watches a game that is simulated on another thread
+
+    The game runs as fast as it can on its own thread and publishes a
+    `Snapshot` whenever the spectator is waiting for one. The main thread
+    draws the latest snapshot at the normal frame rate, so watching never
+    slows the game down.
+    """
+
+    def __init__(self, screen: pygame.surface.Surface) -> None:
+        """__init__ Creates a spectator
+
+        Parameters
+        ----------
+        screen : pygame.surface.Surface
+            The screen the game is drawn on
+        """
+
+        self.screen = screen
+        self._clock = pygame.time.Clock()
+        self._latest = None
+        self._waiting = threading.Event()
+
+    def waiting(self) -> bool:
+        """waiting Returns whether the last snapshot has been drawn"""
+
+        return self._waiting.is_set()
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """publish Offers a new snapshot to be drawn
+
+        Parameters
+        ----------
+        snapshot : Snapshot
+            The latest frame of the game
+        """
+
+        self._latest = snapshot
+        self._waiting.clear()
+
+    def watch(self, game: Game, **kwargs: Any) -> None:
+        """watch Runs a game on another thread and draws it until it ends
+
+        Parameters
+        ----------
+        game : Game
+            The game to run. It is given no screen, it only publishes
+            snapshots to this spectator.
+        **kwargs : Any
+            Passed on to `Game.run_multiple`
+        """
+
+        game.spectator = self
+        self._waiting.set()
+        simulation = threading.Thread(
+            target=game.run_multiple, kwargs=kwargs, daemon=True
+        )
+        simulation.start()
+        while simulation.is_alive():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    game.stop()
+            snapshot = self._latest
+            if snapshot is not None:
+                game.draw(self.screen, snapshot)
+                pygame.display.update()
+            self._waiting.set()
+            self._clock.tick(FPS)
+        simulation.join()
+
+
 class AI(Player):
+    """AI A player controlled by a neural network
+
+    The network is only queried on frames where its decision can take
+    effect. A jump can only start while the player is on the ground, so no
+    decisions are made while the player is in the air.
+
+    Attributes
+    ----------
+    ACTION_REPEAT : int
+        The number of frames on the ground that a decision not to jump is
+        held for before the network is queried again. A decision to jump is
+        acted on immediately and a new decision is made once the player lands.
+    """
+
+    ACTION_REPEAT = 1
+
     def __init__(
         self,
         x: int,
@@ -639,20 +1807,239 @@ class AI(Player):
         self.genome = genome
         self.net = neat.nn.FeedForwardNetwork.create(genome, config)
         genome.fitness = 0
+        self._frames_until_decision = 0
 
     def _handle_input(self) -> None:
+        # Jumping is only possible from the ground, skip inference in the air
+        if not self.on_ground():
+            return
+        self._frames_until_decision -= 1
+        if self._frames_until_decision > 0:
+            return
         inputs = (self.position.y, self.obstacle_handler.get_closest(), FPS)
-        # print(inputs[1])
         if self.net.activate((inputs))[0] > 0.5:
             self.jump()
+            # Decide again as soon as the player is back on the ground
+            self._frames_until_decision = 0
+        else:
+            self._frames_until_decision = self.ACTION_REPEAT
+
+    def frames_until_event(self, limit: int) -> int:
+        # One frame before landing is simulated in full to avoid rounding
+        # differences between the closed form and the frame by frame jump.
+        if not self.on_ground():
+            return min(max(self.frames_until_landing() - 2, 0), limit)
+        if self.velocity.y != 0:
+            return 0
+        # No obstacle spawns or touches the player before `limit`, so the
+        # only input that changes is the distance to the approaching
+        # obstacles. Replay the decisions on those distances to find the
+        # first jump, querying the network again only when the distance
+        # has changed.
+        frame = max(self._frames_until_decision, 1) - 1
+        last_closest = None
+        while frame < limit:
+            closest = self.obstacle_handler.get_closest(frame)
+            if closest != last_closest:
+                inputs = (self.position.y, closest, FPS)
+                if self.net.activate((inputs))[0] > 0.5:
+                    return frame
+                last_closest = closest
+            frame += self.ACTION_REPEAT
+        return limit
+
+    def fast_forward(self, frames: int) -> None:
+        if self._is_alive and self.on_ground():
+            # Every decision made in the skipped frames would be not to jump
+            self._frames_until_decision -= frames
+            if self._frames_until_decision <= 0:
+                self._frames_until_decision = (
+                    (self._frames_until_decision - 1) % self.ACTION_REPEAT
+                ) + 1
+        super().fast_forward(frames)
 
     def _calculate_score(self) -> None:
         super()._calculate_score()
         self.genome.fitness = self.score
 
 
+class TopGenomesReporter(neat.reporting.BaseReporter):
+    """TopGenomesReporter Keeps the fittest genomes of the latest generation
+
+    Attributes
+    ----------
+    top : list
+        Copies of the fittest genomes of the last evaluated generation
+    solved : bool
+        Whether a generation has reached the fitness threshold
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.top = []
+        self.solved = False
+
+    def post_evaluate(self, config, population, species, best_genome):
+        genomes = sorted(
+            population.values(),
+            key=lambda genome: genome.fitness,
+            reverse=True,
+        )
+        self.top = [copy.deepcopy(genome) for genome in genomes[: self.count]]
+
+    def found_solution(self, config, generation, best):
+        self.solved = True
+
+
+class TrainingRecorder(neat.reporting.BaseReporter):
+    """TrainingRecorder Stores the result of every genome in the database
+
+    The fitness and species of each genome are written once per generation
+    as a single batch. Nothing is recorded if the run could not be started,
+    for example when the database is not available.
+    """
+
+    def __init__(self, config_path: str) -> None:
+        self.run_id = start_training_run(
+            username=username,
+            password=password,
+            database_name=DB_NAME,
+            config=config_path,
+        )
+        self.generation = 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if self.run_id is None:
+            return
+        insert_generation_results(
+            username=username,
+            password=password,
+            database_name=DB_NAME,
+            rows=[
+                (
+                    self.run_id,
+                    self.generation,
+                    key,
+                    species.get_species_id(key),
+                    genome.fitness,
+                )
+                for key, genome in population.items()
+            ],
+        )
+
+
+def resident_memory() -> int:
+    """resident_memory Returns the resident set size of this process
+
+    Returns
+    -------
+    int
+        The resident set size in bytes, or the peak resident set size on
+        systems without `/proc`
+    """
+
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        import sys
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in bytes on macOS and in kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryBudgetExceeded(Exception):
+    """MemoryBudgetExceeded Raised when training goes over its memory budget"""
+
+
+class MemoryReporter(neat.reporting.BaseReporter):
+    """MemoryReporter Tracks the memory used by each generation
+
+    At the end of every generation the resident set size is measured. With a
+    report file, `tracemalloc` snapshots are also compared to the previous
+    generation and the allocation sites that grew the most are written out.
+    With a budget, a checkpoint is saved and training is stopped as soon as
+    the resident set size goes over it.
+    """
+
+    TOP_SITES = 10
+
+    def __init__(
+        self, report_path: Optional[str], budget: Optional[float]
+    ) -> None:
+        """__init__ Creates the reporter
+
+        Parameters
+        ----------
+        report_path : str, optional
+            The file a JSON line is appended to for every generation
+        budget : float, optional
+            The most megabytes of resident memory training may use
+        """
+
+        self.report_path = report_path
+        self.budget = budget
+        self.generation = 0
+        self._snapshot = None
+        if self.report_path is not None and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def end_generation(self, config, population, species_set):
+        rss = resident_memory()
+        if self.report_path is not None:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            if self._snapshot is None:
+                statistics = snapshot.statistics("lineno")
+            else:
+                statistics = snapshot.compare_to(self._snapshot, "lineno")
+            self._snapshot = snapshot
+            traced, peak = tracemalloc.get_traced_memory()
+            with open(self.report_path, "a") as file:
+                record = {
+                    "time": time.time(),
+                    "generation": self.generation,
+                    "rss": rss,
+                    "traced": traced,
+                    "traced_peak": peak,
+                    "top_sites": [
+                        str(statistic)
+                        for statistic in statistics[: self.TOP_SITES]
+                    ],
+                }
+                file.write(json.dumps(record) + "\n")
+        if self.budget is not None and rss > self.budget * 1024 * 1024:
+            # The next generation is ready, so training can continue from it
+            checkpointer = neat.Checkpointer(
+                filename_prefix="memory-budget-checkpoint-"
+            )
+            checkpointer.save_checkpoint(
+                config, population, species_set, self.generation + 1
+            )
+            raise MemoryBudgetExceeded(
+                f"Resident memory {rss / 1024 / 1024:.0f} MB is over the "
+                f"{self.budget:.0f} MB budget after generation "
+                f"{self.generation}, saved memory-budget-checkpoint-"
+                f"{self.generation + 1}"
+            )
+
+
 class NeatHelper:
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: str,
+        seed: Optional[int] = None,
+        course: Optional[CourseTape] = None,
+    ) -> None:
         self.config = neat.Config(
             neat.DefaultGenome,
             neat.DefaultReproduction,
@@ -660,64 +2047,380 @@ class NeatHelper:
             neat.DefaultStagnation,
             path,
         )
-
-    def train(self):
-        self.population = neat.Population(self.config)
+        # A fixed course is used for every generation, otherwise a seed gives
+        # each generation its own reproducible course
+        self.seed = seed
+        self.course = course
+        self.spectator = None
+        self.path = path
+        # Champions of past runs, used to warm start and to store results
+        self.archive = None
+        self.seeded = 0
+
+    def train(
+        self,
+        generations: int = 200,
+        restore: Optional[str] = None,
+        warm_start: int = 0,
+    ):
+        if restore is not None:
+            self.population = neat.Checkpointer.restore_checkpoint(restore)
+            self.config = self.population.config
+        else:
+            self.population = neat.Population(self.config)
+        if warm_start > 0 and self.archive is not None:
+            champions = self.archive.champions(
+                warm_start, self.config.genome_config
+            )
+            self._seed_population(champions)
+            self.seeded = len(champions)
         self.population.add_reporter(neat.StdOutReporter(True))
         self.population.add_reporter(neat.StatisticsReporter())
+        self.population.add_reporter(TrainingRecorder(self.path))
+        self._add_memory_reporter()
+
+        return self.population.run(self.fitness, generations)
+
+    def _add_memory_reporter(self) -> None:
+        """_add_memory_reporter Tracks memory when asked on the command line"""
+
+        if args.memory_report is not None or args.memory_budget is not None:
+            self.population.add_reporter(
+                MemoryReporter(args.memory_report, args.memory_budget)
+            )
+
+    def summary(self) -> dict:
+        """summary Describes the outcome of the last training run
+
+        Returns
+        -------
+        dict
+            The number of generations evaluated, whether the fitness threshold
+            was reached and the best fitness
+        """
+
+        best = self.population.best_genome
+        solved = best.fitness >= self.config.fitness_threshold
+        summary = {
+            # The generation counter is not advanced once a solution is found
+            "generations": self.population.generation + (1 if solved else 0),
+            "reached_threshold": solved,
+            "best_fitness": best.fitness,
+        }
+        if self.archive is not None:
+            summary["seeded"] = self.seeded
+        return summary
+
+    def setup(self) -> dict:
+        """setup Describes how the population is trained
+
+        Returns
+        -------
+        dict
+            The configuration file, fitness threshold and population size,
+            and the seed and course tape the obstacle courses come from
+        """
+
+        course = args.course
+        if course is not None:
+            course = os.path.abspath(course)
+        return {
+            "config": os.path.abspath(self.path),
+            "fitness_threshold": self.config.fitness_threshold,
+            "pop_size": self.config.pop_size,
+            "seed": self.seed,
+            "course": course,
+        }
+
+    def archive_champion(self) -> None:
+        """archive_champion Adds the best genome of the run to the archive
+
+        Warm started runs that reach the threshold report how many fewer
+        generations they took than the cold runs already in the archive that
+        were trained the same way.
+        """
+
+        summary = self.summary()
+        setup = self.setup()
+        cold = self.archive.cold_generations(setup, self.config.genome_config)
+        self.archive.add(self.population.best_genome, {**summary, **setup})
+        if self.seeded == 0 or not summary["reached_threshold"]:
+            return
+        if cold is None:
+            print(
+                "No cold runs trained the same way in the archive to compare "
+                "the warm start to"
+            )
+            return
+        print(
+            f"Warm start with {self.seeded} champions reached the threshold "
+            f"in {summary['generations']} generations, cold runs took "
+            f"{cold:.1f} on average ({cold / summary['generations']:.2f}x)"
+        )
+
+    def train_island(
+        self,
+        name: str,
+        address: Tuple[str, int],
+        authkey: bytes,
+        interval: int,
+        migrants: int,
+        generations: int = 200,
+    ):
+        """train_island Evolves the population as one island of many
+
+        Every `interval` generations the island offers its top genomes on the
+        migration board and replaces part of its next generation with the
+        top genomes offered by the other islands.
+
+        Parameters
+        ----------
+        name : str
+            A name for the island that is unique among all islands
+        address : Tuple[str, int]
+            The address of the migration server
+        authkey : bytes
+            The secret used to connect to the migration server
+        interval : int
+            The number of generations between migrations
+        migrants : int
+            The number of genomes offered and taken in on each migration
+        generations : int, optional
+            The maximum number of generations, by default 200
+
+        Returns
+        -------
+        neat.DefaultGenome
+            The best genome evolved on this island
+        """
+
+        manager = MigrationManager(address=address, authkey=authkey)
+        manager.connect()
+        board = manager.get_board()  # type: ignore
+
+        self.population = neat.Population(self.config)
+        self.population.add_reporter(neat.StdOutReporter(False))
+        top_genomes = TopGenomesReporter(migrants)
+        self.population.add_reporter(top_genomes)
+        self.population.add_reporter(TrainingRecorder(self.path))
+
+        while self.population.generation < generations:
+            self.population.run(
+                self.fitness,
+                min(interval, generations - self.population.generation),
+            )
+            board.publish(name, top_genomes.top)
+            if top_genomes.solved:
+                board.solve()
+            if board.solved():
+                break
+            self._seed_population(board.collect(name)[:migrants])
+        return self.population.best_genome
 
-        return self.population.run(self.fitness, 200)
+    def _seed_population(self, genomes) -> None:
+        """_seed_population Adds genomes to the next generation
+
+        Each genome replaces a random member of the population that has not
+        been evaluated yet. The population is then divided into species again.
+
+        Parameters
+        ----------
+        genomes : List[neat.DefaultGenome]
+            The genomes to add, usually taken from another population
+        """
+
+        if len(genomes) == 0:
+            return
+        population = self.population.population
+        replaced = random.sample(
+            list(population), min(len(genomes), len(population))
+        )
+        for key, genome in zip(replaced, genomes):
+            del population[key]
+            genome = copy.deepcopy(genome)
+            genome.key = next(self.population.reproduction.genome_indexer)
+            genome.fitness = None
+            population[genome.key] = genome
+            self.population.reproduction.ancestors[genome.key] = tuple()
+        # New nodes are numbered from a counter shared by the whole
+        # population. Move it past the nodes of the added genomes so their
+        # descendants never get a new node with an existing number.
+        genome_config = self.config.genome_config
+        next_node = max(max(genome.nodes) for genome in genomes) + 1
+        if genome_config.node_indexer is not None:
+            next_node = max(next_node, next(genome_config.node_indexer))
+        genome_config.node_indexer = itertools.count(next_node)
+        self.population.species.speciate(
+            self.config, population, self.population.generation
+        )
 
     def fitness(self, genomes, config):
         runners = []
         obstacleHandler = ObstacleHandler()
+        if self.course is not None:
+            obstacleHandler.set_course(self.course)
+        elif self.seed is not None:
+            generation = self.population.generation
+            obstacleHandler.set_course(
+                obstacleHandler.make_course(self.seed * 1000003 + generation)
+            )
         for _, genome in genomes:
             runners.append(
                 AI(
                     80,
                     350,
-                    pygame.time.get_ticks(),
+                    clock.get_ticks(),
                     obstacleHandler,
                     genome,
                     config,
                 )
             )
-        game = Game(screen, runners, obstacleHandler)
-        game.run_multiple()
+        if self.spectator is not None:
+            # The spectator draws the game, so it runs without a screen
+            game = Game(None, runners, obstacleHandler)
+            self.spectator.watch(game, max_score=config.fitness_threshold)
+            return
+        game = Game(
+            None if args.headless else screen, runners, obstacleHandler
+        )
+        if args.adaptive:
+            game.pacer = FramePacer(FPS)
+        # Nobody watches a headless game, so stop once the remaining runners
+        # have all reached the fitness threshold instead of running forever
+        game.run_multiple(
+            max_score=config.fitness_threshold if args.headless else None
+        )
 
 
-if args.mode == "AI":
-    ai_helper = NeatHelper("./neat_config")
-
-    ai_helper.train()
-elif args.mode == "M":
-    obstacleHandler = ObstacleHandler()
-
-    game = Game(
-        screen=screen,
-        player=[
-            Player(80, 330 + 20, pygame.time.get_ticks(), obstacleHandler)
-        ],
-        obstacleHandler=obstacleHandler,
-    )
+def run_island(name: str, address: Tuple[str, int], authkey: bytes):
+    """run_island Trains one island, used as the target of island processes
 
-    score = game.run_multiple()
+    Parameters
+    ----------
+    name : str
+        A name for the island that is unique among all islands
+    address : Tuple[str, int]
+        The address of the migration server
+    authkey : bytes
+        The secret used to connect to the migration server
+    """
 
-    insertData(
-        username=username,
-        password=password,
-        table_name=TB_NAME,
-        data=("Player", score[0]),
-        database_name=DB_NAME,
+    ai_helper = NeatHelper(args.config, seed=args.seed, course=course)
+    ai_helper.train_island(
+        name,
+        address,
+        authkey,
+        args.migration_interval,
+        args.migrants,
+        args.generations,
     )
 
-    scores = top_five_scores(
-        username=username,
-        password=password,
-        table_name=TB_NAME,
-        database_name=DB_NAME,
-    )
-    print(scores)
-    game.scoreboard(scores)  # type: ignore
 
-pygame.quit()
+AI.ACTION_REPEAT = args.action_repeat
+
+course = None
+if args.course is not None:
+    if not os.path.isfile(args.course):
+        ObstacleHandler().make_course(args.seed or 0).save(args.course)
+    course = CourseTape.load(args.course)
+
+# Island processes import this file too, only the main process dispatches
+if __name__ == "__main__":
+    if args.mode == "AI" and args.islands > 0:
+        # The server unpickles what clients send, so never fall back to a
+        # key anyone could know
+        key = args.authkey or secrets.token_hex(16)
+        authkey = key.encode()
+        # The board is served from this process, islands connect to it
+        server = MigrationManager(
+            address=parse_address(args.migration_address), authkey=authkey
+        ).get_server()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Migration server listening on {server.address}")
+        if args.authkey is None:
+            print(f"Join with --authkey {key}")
+        context = multiprocessing.get_context("spawn")
+        islands = [
+            context.Process(
+                target=run_island,
+                args=(f"island-{i}", server.address, authkey),
+            )
+            for i in range(args.islands)
+        ]
+        for island in islands:
+            island.start()
+        for island in islands:
+            island.join()
+        best = get_board().best()
+        if best is not None:
+            print(f"Best genome across islands: {best.fitness}")
+    elif args.mode == "AI" and args.join is not None:
+        run_island(
+            f"{socket.gethostname()}-{os.getpid()}",
+            parse_address(args.join),
+            args.authkey.encode(),
+        )
+    elif args.mode == "AI":
+        ai_helper = NeatHelper(args.config, seed=args.seed, course=course)
+        if args.spectate:
+            ai_helper.spectator = Spectator(screen)
+        if args.archive is not None:
+            ai_helper.archive = GenomeArchive(args.archive)
+
+        try:
+            ai_helper.train(
+                args.generations,
+                restore=args.restore,
+                warm_start=args.warm_start,
+            )
+        except MemoryBudgetExceeded as e:
+            print(e)
+            raise SystemExit(1)
+        if ai_helper.archive is not None:
+            ai_helper.archive_champion()
+        if args.summary is not None:
+            with open(args.summary, "w") as file:
+                json.dump(ai_helper.summary(), file)
+    elif args.mode == "M":
+        obstacleHandler = ObstacleHandler()
+        if course is not None:
+            obstacleHandler.set_course(course)
+        elif args.seed is not None:
+            obstacleHandler.set_course(obstacleHandler.make_course(args.seed))
+
+        game = Game(
+            screen=screen,
+            player=[
+                Player(80, 330 + 20, clock.get_ticks(), obstacleHandler)
+            ],
+            obstacleHandler=obstacleHandler,
+        )
+
+        game.variable_step = True
+        if args.adaptive:
+            game.pacer = FramePacer(FPS)
+        if args.telemetry is not None:
+            game.telemetry = FrameTelemetry(FPS)
+        score = game.run_multiple()
+        if game.telemetry is not None:
+            game.telemetry.save(args.telemetry)
+
+        insertData(
+            username=username,
+            password=password,
+            table_name=TB_NAME,
+            data=("Player", score[0]),
+            database_name=DB_NAME,
+        )
+
+        game.scoreboard(
+            functools.partial(
+                scores_page,
+                username=username,
+                password=password,
+                table_name=TB_NAME,
+                database_name=DB_NAME,
+            )
+        )
+
+    pygame.quit()
@@ -0,0 +1,299 @@
+# Hyperparameter sweep over neat_config
+#
+# Runs headless training trials in parallel processes, each with its own copy
+# of neat_config, and writes one row per trial to a CSV results table.
+#
+# Example:
+#   python sweep.py --param pop_size=7,20,50 \
+#       --param compatibility_threshold=2.0,3.0 --jobs 4 --timeout 600
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+import csv
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+PROJECT_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_param(text: str) -> Tuple[str, List[str]]:
+    """parse_param Parses a `--param` argument
+
+    Parameters
+    ----------
+    text : str
+        `key=a,b,c` for a list of values or `key=low:high` for a range that
+        random search samples uniformly from. The key is `section.key` or
+        just `key` when the key is only found in one section.
+
+    Returns
+    -------
+    Tuple[str, List[str]]
+        The key and its values. A range is returned as a single `low:high`.
+    """
+
+    key, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected key=values, got {text}")
+    return key.strip(), [value.strip() for value in values.split(",")]
+
+
+def resolve_key(
+    config: configparser.ConfigParser, key: str
+) -> Tuple[str, str]:
+    """resolve_key Finds the section a config key belongs to
+
+    Parameters
+    ----------
+    config : configparser.ConfigParser
+        The base configuration
+    key : str
+        `section.key` or `key`
+
+    Returns
+    -------
+    Tuple[str, str]
+        The section and the key
+    """
+
+    if "." in key:
+        section, _, option = key.partition(".")
+        if not config.has_option(section, option):
+            raise KeyError(f"{key} is not in the configuration")
+        return section, option
+    sections = [s for s in config.sections() if config.has_option(s, key)]
+    if len(sections) != 1:
+        raise KeyError(
+            f"{key} is in {len(sections)} sections, use section.key"
+        )
+    return sections[0], key
+
+
+def sample_value(value: str) -> str:
+    """sample_value Draws a value from a `low:high` range
+
+    Parameters
+    ----------
+    value : str
+        A range, or a single value which is returned unchanged
+
+    Returns
+    -------
+    str
+        The value to write to the configuration
+    """
+
+    if ":" not in value:
+        return value
+    low, high = value.split(":")
+    if "." not in low and "." not in high:
+        return str(random.randint(int(low), int(high)))
+    return f"{random.uniform(float(low), float(high)):.4f}"
+
+
+def trials(
+    space: Dict[str, List[str]], samples: int
+) -> List[Dict[str, str]]:
+    """trials Lists the settings of every trial
+
+    Parameters
+    ----------
+    space : Dict[str, List[str]]
+        The values to try for each key
+    samples : int
+        The number of random trials, or 0 for every combination of the grid
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        The values of each trial
+    """
+
+    keys = list(space)
+    if samples == 0:
+        if any(":" in value for values in space.values() for value in values):
+            raise ValueError("Ranges can only be used with --samples")
+        return [
+            dict(zip(keys, values))
+            for values in itertools.product(*(space[key] for key in keys))
+        ]
+    return [
+        {key: sample_value(random.choice(space[key])) for key in keys}
+        for _ in range(samples)
+    ]
+
+
+def run_trial(
+    number: int,
+    settings: Dict[str, str],
+    base: configparser.ConfigParser,
+    folder: str,
+    arguments: argparse.Namespace,
+) -> Dict[str, object]:
+    """run_trial Trains once with the given settings
+
+    Parameters
+    ----------
+    number : int
+        The trial number, used to name its files
+    settings : Dict[str, str]
+        The configuration values to change
+    base : configparser.ConfigParser
+        The configuration the values are applied to
+    folder : str
+        Folder for the trial's configuration and summary files
+    arguments : argparse.Namespace
+        The sweep's command line arguments
+
+    Returns
+    -------
+    Dict[str, object]
+        A row of the results table
+    """
+
+    config = configparser.ConfigParser()
+    config.read_dict(base)
+    for key, value in settings.items():
+        section, option = resolve_key(config, key)
+        config.set(section, option, value)
+    config_path = os.path.join(folder, f"trial_{number}.cfg")
+    summary_path = os.path.join(folder, f"trial_{number}.json")
+    with open(config_path, "w") as file:
+        config.write(file)
+
+    command = [
+        sys.executable,
+        "main.py",
+        "--type",
+        "AI",
+        "--headless",
+        "--config",
+        config_path,
+        "--generations",
+        str(arguments.generations),
+        "--summary",
+        summary_path,
+    ]
+    if arguments.seed is not None:
+        command += ["--seed", str(arguments.seed)]
+    row = {"trial": number, **settings}
+    start = time.perf_counter()
+    try:
+        subprocess.run(
+            command,
+            cwd=PROJECT_FOLDER,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=arguments.timeout,
+            check=True,
+        )
+        with open(summary_path) as file:
+            row.update(json.load(file))
+        row["status"] = "ok"
+    except subprocess.TimeoutExpired:
+        row["status"] = "timeout"
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        row["status"] = "failed"
+    row["wall_time"] = round(time.perf_counter() - start, 3)
+    print(f"Trial {number} {settings}: {row['status']} in {row['wall_time']}s")
+    return row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Parallel hyperparameter sweep over neat_config",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--param",
+        type=parse_param,
+        action="append",
+        required=True,
+        help="A key and the values to try, e.g. pop_size=7,20,50 or \
+DefaultReproduction.survival_threshold=0.1:0.4\n(ranges need --samples)",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=0,
+        help="Number of random trials (default: 0, try the full grid)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Number of times each trial is run (default: 1)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of trials run at the same time (default: CPU count)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds a trial may run for before it is stopped (default: 600)",
+    )
+    parser.add_argument(
+        "--generations",
+        type=int,
+        default=200,
+        help="Maximum number of generations per trial (default: 200)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Course seed passed to every trial",
+    )
+    parser.add_argument(
+        "--config",
+        default=os.path.join(PROJECT_FOLDER, "neat_config"),
+        help="The configuration to change (default: neat_config)",
+    )
+    parser.add_argument(
+        "--results",
+        default="sweep_results.csv",
+        help="The CSV file results are written to \
+(default: sweep_results.csv)",
+    )
+    arguments = parser.parse_args()
+
+    base = configparser.ConfigParser()
+    base.read(arguments.config)
+    space = dict(arguments.param)
+    for key in space:
+        resolve_key(base, key)
+    settings = [
+        trial
+        for trial in trials(space, arguments.samples)
+        for _ in range(arguments.repeats)
+    ]
+
+    with tempfile.TemporaryDirectory() as folder:
+        with ThreadPoolExecutor(max_workers=arguments.jobs) as executor:
+            rows = list(
+                executor.map(
+                    lambda trial: run_trial(
+                        trial[0], trial[1], base, folder, arguments
+                    ),
+                    enumerate(settings),
+                )
+            )
+
+    columns = ["trial", *space, "status", "generations"]
+    columns += ["reached_threshold", "best_fitness", "wall_time"]
+    with open(arguments.results, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Results written to {arguments.results}")